@@ -7,10 +7,10 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.auth.dependencies import get_current_user
-from src.db.session import get_session
+from src.db.session import get_async_session
 from src.agents.agent_runner import run_agent_with_tools, run_agent_stream
 from src.services.conversation_service import ConversationService
 from src.models.chat_message import MessageRole
@@ -47,7 +47,7 @@ class ChatResponse(BaseModel):
 async def chat_endpoint(
     request: ChatRequest,
     current_user_id: str = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     http_request: Request = None
 ):
     """
@@ -206,7 +206,7 @@ async def chat_endpoint(
 async def chat_stream_endpoint(
     request: ChatRequest,
     current_user_id: str = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     http_request: Request = None
 ):
     """
@@ -362,7 +362,7 @@ async def chat_stream_endpoint(
 @router.get("/conversations", status_code=status.HTTP_200_OK)
 async def list_conversations(
     current_user_id: str = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     limit: int = 20,
     offset: int = 0
 ):
@@ -14,7 +14,7 @@ from sqlmodel import Session
 from src.auth.dependencies import get_current_user
 from src.db.session import get_session
 from src.schemas.task import TaskCreate, TaskResponse, TaskUpdate
-from src.service.task_service import TaskService
+from src.service.task_service import TaskService, build_task_responses
 
 router = APIRouter(prefix="", tags=["tasks"])
 
@@ -93,7 +93,7 @@ def list_tasks(
     filters_applied["sort_order"] = sort_order
 
     return TaskListResponse(
-        tasks=tasks,
+        tasks=build_task_responses(tasks),
         total=total,
         offset=offset,
         limit=limit,
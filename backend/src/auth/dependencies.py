@@ -3,14 +3,41 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 from jwt import PyJWKClient
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import os
+import threading
+import time
 from .jwks import get_jwks_url
 
 
 # HTTP Bearer token scheme
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Verified-token cache: raw token -> (deadline, claims). Ed25519 signature
+# verification dominates per-request auth cost while the same token is
+# reused across many requests, so a hit collapses to a dict lookup plus a
+# deadline check. Entries live until the token's exp claim, capped at ten
+# minutes so a compromised long-lived token cannot outlive rotation longer
+# than that.
+_TOKEN_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_TTL = 600.0
+
+# Failed verifications are remembered briefly (token -> (deadline, detail))
+# so repeated garbage tokens don't each pay a full decode attempt.
+_BAD_TOKEN_CACHE: Dict[str, Tuple[float, str]] = {}
+_BAD_TOKEN_CACHE_MAX = 256
+_BAD_TOKEN_TTL = 5.0
+
+_token_cache_lock = threading.Lock()
+
+
+def clear_token_caches() -> None:
+    """Drop both verified- and failed-token caches. Useful for testing."""
+    with _token_cache_lock:
+        _TOKEN_CACHE.clear()
+        _BAD_TOKEN_CACHE.clear()
+
 
 def verify_jwt_token(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
@@ -42,6 +69,21 @@ def verify_jwt_token(
 
     token = credentials.credentials
 
+    now = time.time()
+    with _token_cache_lock:
+        hit = _TOKEN_CACHE.get(token)
+        if hit is not None:
+            if hit[0] > now:
+                return hit[1]
+            del _TOKEN_CACHE[token]
+        bad = _BAD_TOKEN_CACHE.get(token)
+        if bad is not None and bad[0] > now:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=bad[1],
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
     try:
         # Get expected issuer and audience from environment
         expected_issuer = os.getenv("BETTER_AUTH_ISSUER")
@@ -81,12 +123,25 @@ def verify_jwt_token(
             audience=expected_audience,
         )
 
+        exp = payload.get("exp")
+        if exp:
+            deadline = min(float(exp), now + _TOKEN_CACHE_TTL)
+            with _token_cache_lock:
+                if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+                    _TOKEN_CACHE.clear()
+                _TOKEN_CACHE[token] = (deadline, payload)
+
         return payload
 
     except jwt.InvalidTokenError as e:
+        detail = f"Invalid authentication credentials: {str(e)}"
+        with _token_cache_lock:
+            if len(_BAD_TOKEN_CACHE) >= _BAD_TOKEN_CACHE_MAX:
+                _BAD_TOKEN_CACHE.clear()
+            _BAD_TOKEN_CACHE[token] = (now + _BAD_TOKEN_TTL, detail)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Invalid authentication credentials: {str(e)}",
+            detail=detail,
             headers={"WWW-Authenticate": "Bearer"},
         )
 
@@ -1,38 +1,114 @@
 """JWKS (JSON Web Key Set) fetching and caching for JWT verification."""
 import httpx
-from functools import lru_cache
-from typing import Dict, Any
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
 import os
 
+# Both cache tiers expire after the same TTL so key rotation is picked up
+# within JWKS_CACHE_TTL seconds (default five minutes) without refetching
+# on every request.
+_CACHE_TTL = float(os.getenv("JWKS_CACHE_TTL", "300"))
+
+# On-disk cache shared by all processes (parallel test workers, server
+# restarts): a fresh worker reads the pickled key set instead of paying
+# the first-HTTP-call cost again.
+_DISK_CACHE_PATH = Path.home() / ".cache" / "todo-app" / "jwks.pkl"
+
+# In-memory tier: url -> (expiry deadline, jwks). The lock makes the
+# lookup-or-fetch single-flight, so concurrent requests after expiry
+# trigger one HTTP call instead of a thundering herd.
+_mem_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+
+# One pooled client for the process: keep-alive connections mean a cache
+# miss after expiry reuses the existing TCP/TLS connection instead of
+# paying a fresh handshake per fetch.
+_HTTPX = httpx.Client(
+    timeout=httpx.Timeout(10.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=4),
+)
+
+# Transient network blips shouldn't fail a whole wave of requests: retry
+# the fetch with short exponential backoff before giving up.
+_FETCH_ATTEMPTS = 3
+_RETRY_DELAYS = (0.2, 0.4)
+
+
+def _read_disk_cache(jwks_url: str) -> Optional[Dict[str, Any]]:
+    """Return the disk-cached JWKS for this URL if present and fresh."""
+    try:
+        if time.time() - _DISK_CACHE_PATH.stat().st_mtime > _CACHE_TTL:
+            return None
+        with open(_DISK_CACHE_PATH, "rb") as f:
+            cached_url, jwks = pickle.load(f)
+        return jwks if cached_url == jwks_url else None
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        return None
+
+
+def _write_disk_cache(jwks_url: str, jwks: Dict[str, Any]) -> None:
+    """Persist the JWKS for other processes; failures are non-fatal."""
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _DISK_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((jwks_url, jwks), f)
+        tmp_path.replace(_DISK_CACHE_PATH)
+    except OSError:
+        pass
+
 
-@lru_cache(maxsize=1)
 def fetch_jwks(jwks_url: str) -> Dict[str, Any]:
     """
     Fetch JSON Web Key Set (JWKS) from Better Auth.
-    
+
     The JWKS contains public keys used to verify JWT signatures.
-    Results are cached for 1 hour to minimize network requests.
-    
+    Two cache tiers, both TTL-bounded (JWKS_CACHE_TTL env var): an
+    in-memory dict within the process, plus an on-disk copy so sibling
+    processes skip the network round-trip. Unlike a forever lru_cache,
+    expired entries are refetched, so rotated keys are honored.
+
     Args:
         jwks_url: URL to Better Auth JWKS endpoint (e.g., http://localhost:3000/api/auth/jwks)
-    
+
     Returns:
         JWKS dictionary with "keys" array containing public key data
-    
+
     Raises:
-        httpx.HTTPError: If JWKS fetch fails
+        RuntimeError: If JWKS fetch fails
     """
-    try:
-        response = httpx.get(jwks_url, timeout=10.0)
-        response.raise_for_status()
-        jwks = response.json()
-        
-        if "keys" not in jwks or not isinstance(jwks["keys"], list):
-            raise ValueError(f"Invalid JWKS format: {jwks}")
-        
-        return jwks
-    except httpx.HTTPError as e:
-        raise RuntimeError(f"Failed to fetch JWKS from {jwks_url}: {e}")
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _mem_cache.get(jwks_url)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        cached = _read_disk_cache(jwks_url)
+        if cached is not None:
+            _mem_cache[jwks_url] = (now + _CACHE_TTL, cached)
+            return cached
+
+        for attempt in range(_FETCH_ATTEMPTS):
+            try:
+                response = _HTTPX.get(jwks_url)
+                response.raise_for_status()
+                jwks = response.json()
+
+                if "keys" not in jwks or not isinstance(jwks["keys"], list):
+                    raise ValueError(f"Invalid JWKS format: {jwks}")
+
+                _mem_cache[jwks_url] = (now + _CACHE_TTL, jwks)
+                _write_disk_cache(jwks_url, jwks)
+                return jwks
+            except httpx.HTTPError as e:
+                if attempt == _FETCH_ATTEMPTS - 1:
+                    raise RuntimeError(
+                        f"Failed to fetch JWKS from {jwks_url}: {e}"
+                    )
+                time.sleep(_RETRY_DELAYS[attempt])
 
 
 def get_jwks_url() -> str:
@@ -47,5 +123,10 @@ def get_jwks_url() -> str:
 
 
 def clear_jwks_cache():
-    """Clear the JWKS cache. Useful for testing or key rotation."""
-    fetch_jwks.cache_clear()
+    """Clear both JWKS cache tiers. Useful for testing or key rotation."""
+    with _cache_lock:
+        _mem_cache.clear()
+    try:
+        _DISK_CACHE_PATH.unlink()
+    except OSError:
+        pass
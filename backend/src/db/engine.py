@@ -1,5 +1,7 @@
 """Database engine configuration for PostgreSQL with SQLModel."""
 from sqlmodel import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import NullPool
 import os
 from dotenv import load_dotenv
@@ -26,6 +28,40 @@ engine = create_engine(
     max_overflow=10,  # Allow burst connections
 )
 
+# Async engine for non-blocking request paths (chat endpoints).
+# Reuses DATABASE_URL but swaps in an async driver so DB I/O can
+# overlap with other requests instead of blocking the event loop.
+def _derive_async_url(database_url: str) -> str:
+    """Translate the sync DATABASE_URL into its async-driver equivalent.
+
+    A bare prefix swap is not enough: asyncpg has no ``sslmode`` keyword,
+    so the documented Neon URL (``...?sslmode=require``) must carry the
+    setting as asyncpg's ``ssl`` parameter instead. SQLite (used in
+    tests) maps to the aiosqlite driver.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        if sslmode is not None:
+            query["ssl"] = sslmode
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = _derive_async_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=True,  # Log SQL queries (disable in production)
+    pool_pre_ping=True,  # Verify connection health
+    pool_size=5,  # Small pool for serverless
+    max_overflow=10,  # Allow burst connections
+)
+
 # For testing: Use NullPool to avoid connection pooling issues
 def create_test_engine(database_url: str):
     """Create engine for testing with NullPool."""
@@ -1,7 +1,8 @@
 """Database session management with dependency injection."""
 from sqlmodel import Session
-from typing import Generator
-from .engine import engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import AsyncGenerator, Generator
+from .engine import engine, async_engine
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -26,6 +27,26 @@ def get_session() -> Generator[Session, None, None]:
             raise
 
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides an async database session.
+
+    Used by the chat endpoints so DB round-trips don't block the
+    event loop under concurrent load.
+
+    expire_on_commit=False: handlers read attributes (e.g. the new
+    conversation's PK) after commit, and an expired instance would try a
+    lazy refresh outside the async context and raise MissingGreenlet.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 def get_session_sync() -> Session:
     """Create a synchronous database session for MCP tools."""
     return Session(engine)
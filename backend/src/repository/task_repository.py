@@ -101,6 +101,32 @@ class TaskRepository:
         result = self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """
+        Get multiple tasks by ID in a single query.
+
+        Only returns tasks that belong to the authenticated user;
+        unknown or foreign IDs are silently omitted.
+
+        Args:
+            task_ids: The task IDs to look up.
+
+        Returns:
+            List of Task instances owned by the user.
+        """
+        if not task_ids:
+            return []
+
+        statement = (
+            select(Task)
+            .where(
+                Task.id.in_(task_ids),
+                Task.user_id == self.user_id,  # user_id is a string
+            )
+        )
+        result = self.session.execute(statement)
+        return list(result.scalars().all())
+
     def update(
         self,
         task_id: int,
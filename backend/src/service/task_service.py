@@ -5,16 +5,102 @@ Coordinates between API layer and repository layer,
 applying business rules and validation before data operations.
 """
 
+import operator
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Tuple
-from calendar import monthrange
 
 from sqlmodel import Session
 
 from src.models.task import Task, RecurrencePattern
-from src.schemas.task import TaskCreate, TaskUpdate
+from src.schemas.task import TaskCreate, TaskResponse, TaskUpdate
 from src.repository.task_repository import TaskRepository
 
+# Precomputed time-of-day constants (avoid rebuilding them on every call)
+_MAX_TIME = datetime.max.time()
+_MIN_TIME = datetime.min.time()
+
+# Precomputed recurrence intervals (avoid a timedelta allocation per call)
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(weeks=1)
+
+
+def _next_due_daily(current_due_date: datetime) -> datetime:
+    return current_due_date + _ONE_DAY
+
+
+def _next_due_weekly(current_due_date: datetime) -> datetime:
+    return current_due_date + _ONE_WEEK
+
+
+def _next_due_monthly(current_due_date: datetime) -> datetime:
+    # Deferred import: only the monthly branch needs calendar, so keep it
+    # off the module-import (cold start) path. Cached after the first call.
+    from calendar import monthrange
+
+    # Handle month-end edge cases
+    current_day = current_due_date.day
+    current_month = current_due_date.month
+    current_year = current_due_date.year
+
+    # Calculate next month
+    next_month = current_month + 1
+    next_year = current_year
+    if next_month > 12:
+        next_month = 1
+        next_year += 1
+
+    # Get last day of next month
+    _, last_day_of_next_month = monthrange(next_year, next_month)
+
+    # Use minimum of current_day and last_day_of_next_month
+    # This handles Jan 31 -> Feb 28/29 correctly
+    next_day = min(current_day, last_day_of_next_month)
+
+    # Construct next due date with same time
+    return current_due_date.replace(
+        year=next_year,
+        month=next_month,
+        day=next_day
+    )
+
+
+# Response-hydration fast path: a single C-level attrgetter pulls every
+# TaskResponse field off the ORM row, and model_construct skips
+# re-validating values that came straight from the database.
+_TASK_RESPONSE_FIELDS = (
+    'id', 'title', 'description', 'completed', 'created_at', 'updated_at',
+    'priority', 'tags', 'due_date', 'notification_sent', 'is_recurring',
+    'recurrence_pattern', 'recurrence_end_date', 'parent_task_id',
+)
+_get_task_response_fields = operator.attrgetter(*_TASK_RESPONSE_FIELDS)
+
+
+def build_task_responses(tasks: List[Task]) -> List[TaskResponse]:
+    """
+    Convert a batch of Task rows to TaskResponse schemas without
+    per-field Python attribute access or Pydantic validation.
+
+    Args:
+        tasks: Task ORM instances loaded from the database.
+
+    Returns:
+        List of TaskResponse instances, in the same order.
+    """
+    return [
+        TaskResponse.model_construct(
+            **dict(zip(_TASK_RESPONSE_FIELDS, _get_task_response_fields(task)))
+        )
+        for task in tasks
+    ]
+
+
+# Single hash lookup instead of an if/elif chain on the pattern enum
+_NEXT_DUE_DATE_DISPATCH = {
+    RecurrencePattern.DAILY: _next_due_daily,
+    RecurrencePattern.WEEKLY: _next_due_weekly,
+    RecurrencePattern.MONTHLY: _next_due_monthly,
+}
+
 
 class TaskService:
     """
@@ -221,41 +307,10 @@ class TaskService:
         Raises:
             ValueError: If pattern is invalid
         """
-        if pattern == RecurrencePattern.DAILY:
-            return current_due_date + timedelta(days=1)
-
-        elif pattern == RecurrencePattern.WEEKLY:
-            return current_due_date + timedelta(weeks=1)
-
-        elif pattern == RecurrencePattern.MONTHLY:
-            # Handle month-end edge cases
-            current_day = current_due_date.day
-            current_month = current_due_date.month
-            current_year = current_due_date.year
-
-            # Calculate next month
-            next_month = current_month + 1
-            next_year = current_year
-            if next_month > 12:
-                next_month = 1
-                next_year += 1
-
-            # Get last day of next month
-            _, last_day_of_next_month = monthrange(next_year, next_month)
-
-            # Use minimum of current_day and last_day_of_next_month
-            # This handles Jan 31 -> Feb 28/29 correctly
-            next_day = min(current_day, last_day_of_next_month)
-
-            # Construct next due date with same time
-            return current_due_date.replace(
-                year=next_year,
-                month=next_month,
-                day=next_day
-            )
-
-        else:
+        calculate = _NEXT_DUE_DATE_DISPATCH.get(pattern)
+        if calculate is None:
             raise ValueError(f"Invalid recurrence pattern: {pattern}")
+        return calculate(current_due_date)
 
     def should_generate_next_instance(
         self,
@@ -283,7 +338,7 @@ class TaskService:
         # Use end of day (23:59:59) to make it inclusive
         end_datetime = datetime.combine(
             task.recurrence_end_date,
-            datetime.max.time()
+            _MAX_TIME
         ).replace(tzinfo=timezone.utc)
 
         return next_due_date <= end_datetime
@@ -335,13 +390,13 @@ class TaskService:
             title=task.title,
             description=task.description,
             priority=task.priority,
-            tags=task.tags.copy() if task.tags else [],
+            tags=task.tags or [],  # validator builds a fresh list; no defensive copy needed
             due_date=next_due_date,
             is_recurring=task.is_recurring,
             recurrence_pattern=task.recurrence_pattern,
             recurrence_end_date=datetime.combine(
                 task.recurrence_end_date,
-                datetime.min.time()
+                _MIN_TIME
             ).replace(tzinfo=timezone.utc) if task.recurrence_end_date else None,
             parent_task_id=task.id,
         )
@@ -350,3 +405,66 @@ class TaskService:
         self.session.commit()
 
         return (task, next_instance)
+
+    def complete_tasks_bulk(
+        self,
+        task_ids: List[int],
+    ) -> List[Tuple[Task, Optional[Task]]]:
+        """
+        Mark multiple tasks as complete in a single transaction.
+
+        Loads all matching tasks with one SELECT, computes next recurring
+        instances in Python, then issues one bulk INSERT + UPDATE via a
+        single commit instead of per-task round-trips.
+
+        Args:
+            task_ids: IDs of the tasks to complete
+
+        Returns:
+            List of (completed_task, next_instance) tuples, one per task
+            found; next_instance is None for non-recurring tasks or when
+            the recurrence end date has been reached.
+        """
+        tasks = self.repository.get_by_ids(task_ids)
+        if not tasks:
+            return []
+
+        now = datetime.now(timezone.utc)
+        results: List[Tuple[Task, Optional[Task]]] = []
+        next_instances: List[Task] = []
+
+        for task in tasks:
+            task.completed = True
+            task.updated_at = now
+
+            next_instance = None
+            if task.is_recurring and task.recurrence_pattern and task.due_date:
+                next_due_date = self.calculate_next_due_date(
+                    task.due_date,
+                    task.recurrence_pattern
+                )
+                if self.should_generate_next_instance(task, next_due_date):
+                    next_instance = Task(
+                        user_id=self.user_id,
+                        title=task.title,
+                        description=task.description,
+                        priority=task.priority,
+                        tags=task.tags or [],
+                        due_date=next_due_date,
+                        is_recurring=task.is_recurring,
+                        recurrence_pattern=task.recurrence_pattern,
+                        recurrence_end_date=task.recurrence_end_date,
+                        parent_task_id=task.id,
+                    )
+                    next_instances.append(next_instance)
+
+            results.append((task, next_instance))
+
+        # One bulk INSERT for all next instances, one UPDATE flush for the
+        # completed parents, one commit total.
+        self.session.add_all(tasks)
+        if next_instances:
+            self.session.add_all(next_instances)
+        self.session.commit()
+
+        return results
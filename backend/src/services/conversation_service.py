@@ -6,21 +6,33 @@ conversation history for multi-turn context.
 """
 from typing import Optional, Any
 from datetime import datetime, timezone
-from sqlmodel import Session, select, desc
+from sqlalchemy import String, case, cast, delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, desc
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.models.chat_conversation import ChatConversation
 from src.models.chat_message import ChatMessage, MessageRole
 
+# Wire-format lookup table for message roles, built once at import.
+# The agent API speaks "assistant" where the database enum says "agent";
+# every other role maps straight through.
+_ROLE_TO_WIRE = {
+    MessageRole.USER: "user",
+    MessageRole.AGENT: "assistant",
+    MessageRole.SYSTEM: "system",
+}
+
 
 class ConversationService:
     """Service for managing chat conversations and messages."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         """
         Initialize conversation service with database session.
 
         Args:
-            db_session: SQLModel database session
+            db_session: SQLModel async database session
         """
         self.db = db_session
 
@@ -43,21 +55,32 @@ class ConversationService:
             ValueError: If conversation_id provided but not found or not owned by user
         """
         if conversation_id:
-            # Load existing conversation
-            conversation = self.db.get(ChatConversation, conversation_id)
-            if not conversation:
-                raise ValueError(f"Conversation #{conversation_id} not found")
-            if conversation.user_id != user_id:
+            # Ownership check via a narrow indexed SELECT instead of
+            # hydrating the full row; callers only use conversation_id.
+            owns = (await self.db.exec(
+                select(ChatConversation.conversation_id).where(
+                    ChatConversation.conversation_id == conversation_id,
+                    ChatConversation.user_id == user_id,
+                )
+            )).first()
+            if owns is None:
                 raise ValueError(
-                    f"Conversation #{conversation_id} does not belong to user {user_id}"
+                    f"Conversation #{conversation_id} not found for user {user_id}"
                 )
-            return conversation
+            # Transient instance carrying the verified identifiers — not
+            # attached to the session, never re-persisted.
+            return ChatConversation(
+                conversation_id=conversation_id,
+                user_id=user_id,
+            )
         else:
-            # Create new conversation
+            # Create new conversation. The INSERT's RETURNING clause already
+            # populates the generated PK on flush, so no post-commit refresh
+            # (a second SELECT) is needed.
             conversation = ChatConversation(user_id=user_id)
             self.db.add(conversation)
-            self.db.commit()
-            self.db.refresh(conversation)
+            await self.db.flush()
+            await self.db.commit()
             return conversation
 
     async def load_conversation_history(
@@ -79,23 +102,37 @@ class ConversationService:
             [{"role": "user"/"agent"/"system", "content": "..."}, ...]
             Ordered chronologically (oldest first)
         """
-        # Query messages for this conversation
+        # Select only the two columns the agent needs; skipping full ORM
+        # hydration keeps long histories cheap, and the existing
+        # (conversation_id, created_at) composite index covers the scan.
+        # The role-to-wire mapping is pushed down into SQL so each row
+        # comes back as two ready-to-use strings; the CASE branches are
+        # generated from the _ROLE_TO_WIRE table compiled at import.
         statement = (
-            select(ChatMessage)
+            select(
+                case(
+                    *(
+                        (ChatMessage.role == role, wire)
+                        for role, wire in _ROLE_TO_WIRE.items()
+                        if role.value != wire
+                    ),
+                    # Cast to text so the CASE resolves as a string, not the
+                    # message_role enum (which has no 'assistant' value).
+                    else_=cast(ChatMessage.role, String),
+                ).label("role"),
+                ChatMessage.content,
+            )
             .where(ChatMessage.conversation_id == conversation_id)
             .order_by(ChatMessage.created_at)
             .offset(offset)
             .limit(limit)
         )
-        messages = self.db.exec(statement).all()
+        rows = (await self.db.exec(statement)).all()
 
         # Convert to agent-compatible format
         return [
-            {
-                "role": "assistant" if msg.role == MessageRole.AGENT else msg.role.value,
-                "content": msg.content
-            }
-            for msg in messages
+            {"role": role, "content": content}
+            for role, content in rows
         ]
 
     async def save_message(
@@ -122,11 +159,6 @@ class ConversationService:
         Raises:
             ValueError: If conversation not found or invalid role
         """
-        # Verify conversation exists
-        conversation = self.db.get(ChatConversation, conversation_id)
-        if not conversation:
-            raise ValueError(f"Conversation #{conversation_id} not found")
-
         # Validate role value
         valid_roles = ['user', 'agent', 'system']
         if role not in valid_roles:
@@ -141,9 +173,14 @@ class ConversationService:
             message_metadata=metadata
         )
 
+        # No existence pre-check: the conversation FK constraint catches a
+        # missing conversation on commit, saving a SELECT per message.
         self.db.add(message)
-        self.db.commit()
-        self.db.refresh(message)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError(f"Conversation #{conversation_id} not found")
 
         # Note: conversation.updated_at is automatically updated by database trigger
 
@@ -173,7 +210,7 @@ class ConversationService:
             .offset(offset)
             .limit(limit)
         )
-        return list(self.db.exec(statement).all())
+        return list((await self.db.exec(statement)).all())
 
     async def delete_conversation(self, conversation_id: int, user_id: str) -> None:
         """
@@ -186,13 +223,17 @@ class ConversationService:
         Raises:
             ValueError: If conversation not found or not owned by user
         """
-        conversation = self.db.get(ChatConversation, conversation_id)
-        if not conversation:
-            raise ValueError(f"Conversation #{conversation_id} not found")
-        if conversation.user_id != user_id:
+        # Single DELETE scoped to owner; messages go with it via the
+        # ON DELETE CASCADE foreign key, so no child rows are loaded into
+        # the session regardless of conversation length.
+        result = await self.db.execute(
+            delete(ChatConversation).where(
+                ChatConversation.conversation_id == conversation_id,
+                ChatConversation.user_id == user_id,
+            )
+        )
+        if result.rowcount == 0:
             raise ValueError(
-                f"Conversation #{conversation_id} does not belong to user {user_id}"
+                f"Conversation #{conversation_id} not found for user {user_id}"
             )
-
-        self.db.delete(conversation)
-        self.db.commit()
+        await self.db.commit()
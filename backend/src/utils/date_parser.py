@@ -5,12 +5,76 @@ This module provides functions to parse natural language date expressions
 like "tomorrow", "next week", "next month", etc. into ISO format dates
 using the current system date as the base.
 """
-from datetime import datetime, timedelta
-import calendar
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import re
 from typing import Optional
 
 
+# Month lengths for a non-leap year; February is adjusted in _max_days.
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _max_days(year: int, month: int) -> int:
+    """Days in the given month: one table lookup plus a leap-year test."""
+    if month == 2 and ((year % 4 == 0 and year % 100 != 0) or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
+
+
+def _add_months_kernel(year: int, month: int, day: int, add: int) -> tuple[int, int, int]:
+    """
+    Pure-integer month addition with end-of-month clamping.
+
+    Keeps the "in X months" math in straight arithmetic (table lookup
+    instead of a calendar.monthrange dispatch), e.g. Jan 31 + 1 month
+    clamps to Feb 28/29 rather than spilling into March.
+    """
+    target_month = month + add
+    target_year = year + (target_month - 1) // 12
+    target_month = ((target_month - 1) % 12) + 1
+    max_days = _max_days(target_year, target_month)
+    return target_year, target_month, day if day < max_days else max_days
+
+# Compiled once at import so the hot parsing path never touches re's
+# internal pattern cache (which is capped and subject to eviction).
+_WEEKDAY_PATTERNS = [
+    (re.compile(r'next\s+monday'), 0), (re.compile(r'next\s+tuesday'), 1),
+    (re.compile(r'next\s+wednesday'), 2), (re.compile(r'next\s+thursday'), 3),
+    (re.compile(r'next\s+friday'), 4), (re.compile(r'next\s+saturday'), 5),
+    (re.compile(r'next\s+sunday'), 6),
+]
+# All "in X <unit>" / "X days from now" forms in one alternation with a
+# unit capture, so the relative-offset check is a single scan instead of
+# five separate regex invocations.
+_IN_N_UNIT = re.compile(
+    r'(?:in\s+(\d+)\s+(day|week|month|year)s?)|(?:(\d+)\s+days?\s+from\s+now)'
+)
+_TIME_AT = re.compile(r'at\s+(\d{1,2})(?::(\d{2}))?\s*(AM|PM|am|pm)?', re.IGNORECASE)
+
+# Fixed phrases mapping to a day offset from today. Order matters for the
+# containment scan: more specific phrases must come before their substrings
+# (e.g. "day after tomorrow" before "tomorrow", "day after today" before
+# "today"), mirroring the branch order of the original if/elif chain.
+_PHRASE_OFFSETS = (
+    ("day after tomorrow", 2), ("two days from now", 2), ("in two days", 2),
+    ("tomorrow", 1), ("next day", 1), ("day after today", 1),
+    ("yesterday", -1),
+    ("today", 0), ("now", 0), ("current", 0),
+    ("in 1 day", 1), ("1 day from now", 1),
+    ("in 2 days", 2), ("2 days from now", 2),
+    ("in 3 days", 3), ("3 days from now", 3),
+    ("in 4 days", 4), ("4 days from now", 4),
+    ("in 5 days", 5), ("5 days from now", 5),
+    ("in 6 days", 6), ("6 days from now", 6),
+    ("in 7 days", 7), ("7 days from now", 7),
+)
+
+# Exact-match fast path: most tool-call arguments are exactly one of the
+# phrases, so a single dict lookup beats scanning the table at all.
+_OFFSETS = dict(_PHRASE_OFFSETS)
+
+
 def parse_natural_language_date(date_expression: str) -> Optional[str]:
     """
     Parse natural language date expressions into ISO format date string,
@@ -26,143 +90,97 @@ def parse_natural_language_date(date_expression: str) -> Optional[str]:
         return None
 
     try:
-        # Convert to lowercase for case-insensitive matching
+        # Normalize before the cache lookup so "Tomorrow" and "tomorrow "
+        # share an entry; keying on today's ordinal keeps cached results
+        # correct across midnight.
         expr = date_expression.lower().strip()
+        today_ord = datetime.now().date().toordinal()
+        return _parse_normalized(expr, today_ord)
+    except Exception:
+        # If any parsing fails, return None so the original expression can be passed through
+        return None
 
-        # Get today's date for reference - always use system date to avoid fixed context issues
-        today = datetime.now().date()
-
-        # Parse specific expressions
-        if "day after tomorrow" in expr or "two days from now" in expr or "in two days" in expr:
-            target_date = today + timedelta(days=2)
-            return target_date.isoformat()
-
-        elif "tomorrow" in expr or "next day" in expr or "day after today" in expr:
-            target_date = today + timedelta(days=1)
-            return target_date.isoformat()
-
-        elif "yesterday" in expr:
-            target_date = today - timedelta(days=1)
-            return target_date.isoformat()
-
-        elif "today" in expr or "now" in expr or "current" in expr:
-            return today.isoformat()
-
-        elif "in 1 day" in expr or "1 day from now" in expr:
-            target_date = today + timedelta(days=1)
-            return target_date.isoformat()
-
-        elif "in 2 days" in expr or "2 days from now" in expr:
-            target_date = today + timedelta(days=2)
-            return target_date.isoformat()
-
-        elif "in 3 days" in expr or "3 days from now" in expr:
-            target_date = today + timedelta(days=3)
-            return target_date.isoformat()
-
-        elif "in 4 days" in expr or "4 days from now" in expr:
-            target_date = today + timedelta(days=4)
-            return target_date.isoformat()
-
-        elif "in 5 days" in expr or "5 days from now" in expr:
-            target_date = today + timedelta(days=5)
-            return target_date.isoformat()
-
-        elif "in 6 days" in expr or "6 days from now" in expr:
-            target_date = today + timedelta(days=6)
-            return target_date.isoformat()
 
-        elif "in 7 days" in expr or "7 days from now" in expr:
-            target_date = today + timedelta(days=7)
-            return target_date.isoformat()
+@lru_cache(maxsize=512)
+def _parse_normalized(expr: str, today_ord: int) -> Optional[str]:
+    """
+    Parse a lowercased, stripped expression against a fixed base ordinal.
 
-        # Handle "next week" - find next Monday
-        elif "next week" in expr:
-            # Calculate next Monday
-            days_ahead = 0 - today.weekday()  # 0 is Monday
+    Memoized: chat tool calls repeat the same handful of expressions
+    ("tomorrow", "next week"), so re-parsing them within the same day is a
+    dict hit instead of a regex cascade.
+    """
+    today = date.fromordinal(today_ord)
+
+    # Parse fixed phrases: exact-match dict lookup first, then a single
+    # ordered containment scan for phrases embedded in longer text.
+    offset = _OFFSETS.get(expr)
+    if offset is None:
+        for phrase, phrase_offset in _PHRASE_OFFSETS:
+            if phrase in expr:
+                offset = phrase_offset
+                break
+    if offset is not None:
+        return date.fromordinal(today_ord + offset).isoformat()
+
+    # Handle "next week" - find next Monday
+    if "next week" in expr:
+        # Calculate next Monday
+        days_ahead = 0 - today.weekday()  # 0 is Monday
+        if days_ahead <= 0:  # Target day already happened this week
+            days_ahead += 7
+        return date.fromordinal(today_ord + days_ahead).isoformat()
+
+    # Handle "next month" - find first day of next month
+    elif "next month" in expr:
+        if today.month == 12:
+            target_date = today.replace(year=today.year + 1, month=1, day=1)
+        else:
+            target_date = today.replace(month=today.month + 1, day=1)
+        return target_date.isoformat()
+
+    # Handle "next year" - find first day of next year
+    elif "next year" in expr:
+        target_date = today.replace(year=today.year + 1, month=1, day=1)
+        return target_date.isoformat()
+
+    # Look for weekday expressions like "next Monday", "next Tuesday", etc.
+    for pattern, weekday_num in _WEEKDAY_PATTERNS:
+        if pattern.search(expr):
+            # Find the next occurrence of this weekday
+            days_ahead = weekday_num - today.weekday()
             if days_ahead <= 0:  # Target day already happened this week
                 days_ahead += 7
-            target_date = today + timedelta(days=days_ahead)
-            return target_date.isoformat()
-
-        # Handle "next month" - find first day of next month
-        elif "next month" in expr:
-            if today.month == 12:
-                target_date = today.replace(year=today.year + 1, month=1, day=1)
-            else:
-                target_date = today.replace(month=today.month + 1, day=1)
-            return target_date.isoformat()
-
-        # Handle "next year" - find first day of next year
-        elif "next year" in expr:
-            target_date = today.replace(year=today.year + 1, month=1, day=1)
-            return target_date.isoformat()
-
-        # Look for weekday expressions like "next Monday", "next Tuesday", etc.
-        weekday_patterns = [
-            (r'next\s+monday', 0), (r'next\s+tuesday', 1), (r'next\s+wednesday', 2),
-            (r'next\s+thursday', 3), (r'next\s+friday', 4), (r'next\s+saturday', 5), (r'next\s+sunday', 6)
-        ]
-
-        for pattern, weekday_num in weekday_patterns:
-            if re.search(pattern, expr):
-                # Find the next occurrence of this weekday
-                days_ahead = weekday_num - today.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-                target_date = today + timedelta(days=days_ahead)
-                return target_date.isoformat()
-
-        # Check for relative day expressions like "in 3 days", "3 days from now", etc.
-        match = re.search(r'in\s+(\d+)\s+days?', expr)
-        if match:
-            days = int(match.group(1))
-            target_date = today + timedelta(days=days)
-            return target_date.isoformat()
-
-        # Check for "X days from now" expressions
-        match = re.search(r'(\d+)\s+days?\s+from\s+now', expr)
-        if match:
-            days = int(match.group(1))
-            target_date = today + timedelta(days=days)
-            return target_date.isoformat()
-
-        # Check for "in X weeks" expressions
-        match = re.search(r'in\s+(\d+)\s+weeks?', expr)
-        if match:
-            weeks = int(match.group(1))
-            target_date = today + timedelta(weeks=weeks)
-            return target_date.isoformat()
-
-        # Check for "in X months" expressions
-        match = re.search(r'in\s+(\d+)\s+months?', expr)
-        if match:
-            months = int(match.group(1))
-            # Calculate target month and year
-            target_month = today.month + months
-            target_year = today.year + (target_month - 1) // 12
-            target_month = ((target_month - 1) % 12) + 1
-            # Handle day overflow (e.g., Jan 31 + 1 month should go to Feb 28/29, not Mar 3)
-            max_days_in_month = calendar.monthrange(target_year, target_month)[1]
-            target_day = min(today.day, max_days_in_month)
-            target_date = today.replace(year=target_year, month=target_month, day=target_day)
-            return target_date.isoformat()
-
-        # Check for "in X years" expressions
-        match = re.search(r'in\s+(\d+)\s+years?', expr)
-        if match:
-            years = int(match.group(1))
+            return date.fromordinal(today_ord + days_ahead).isoformat()
+
+    # Check relative expressions ("in 3 days", "2 weeks", "5 days from now",
+    # "in X months/years") with a single combined scan, then dispatch on
+    # the captured unit.
+    match = _IN_N_UNIT.search(expr)
+    if match:
+        if match.group(3) is not None:  # "X days from now"
+            return date.fromordinal(today_ord + int(match.group(3))).isoformat()
+
+        n = int(match.group(1))
+        unit = match.group(2)
+        if unit == 'day':
+            return date.fromordinal(today_ord + n).isoformat()
+        elif unit == 'week':
+            return date.fromordinal(today_ord + 7 * n).isoformat()
+        elif unit == 'month':
+            target_year, target_month, target_day = _add_months_kernel(
+                today.year, today.month, today.day, n
+            )
+            return date(target_year, target_month, target_day).isoformat()
+        else:  # 'year'
             try:
-                target_date = today.replace(year=today.year + years)
+                target_date = today.replace(year=today.year + n)
             except ValueError:  # Handle leap year edge case (Feb 29 + 1 year)
-                target_date = today.replace(year=today.year + years, day=28)
+                target_date = today.replace(year=today.year + n, day=28)
             return target_date.isoformat()
 
-        # If we can't parse it, return None so the original expression can be passed through
-        return None
-    except Exception:
-        # If any parsing fails, return None so the original expression can be passed through
-        return None
+    # If we can't parse it, return None so the original expression can be passed through
+    return None
 
 
 def parse_datetime_with_time(date_expr: str) -> Optional[str]:
@@ -180,10 +198,16 @@ def parse_datetime_with_time(date_expr: str) -> Optional[str]:
 
     try:
         # Extract time information if present
-        time_match = re.search(r'at\s+(\d{1,2})(?::(\d{2}))?\s*(AM|PM|am|pm)?', date_expr, re.IGNORECASE)
+        time_match = _TIME_AT.search(date_expr)
 
-        # Get the date part without time
-        date_part = re.sub(r'\s+at\s+\d{1,2}(?::\d{2})?\s*(AM|PM|am|pm)?', '', date_expr, flags=re.IGNORECASE).strip()
+        # Get the date part without time: slice around the match instead of
+        # a second regex pass over the same string
+        if time_match:
+            date_part = (
+                date_expr[:time_match.start()] + date_expr[time_match.end():]
+            ).strip()
+        else:
+            date_part = date_expr.strip()
 
         # Parse the date part - don't try the full expression with time as it won't match date patterns
         date_str = parse_natural_language_date(date_part)
@@ -230,10 +254,13 @@ def parse_date_expression(date_expr: str) -> Optional[str]:
         return None
 
     try:
-        # Try to parse as datetime first (with potential time)
-        result = parse_datetime_with_time(date_expr)
-        if result:
-            return result
+        # Only attempt datetime parsing when a time fragment can actually be
+        # present — most expressions ("tomorrow", "next week") have none, so
+        # this skips two regex passes on the common path.
+        if ' at ' in date_expr.lower():
+            result = parse_datetime_with_time(date_expr)
+            if result:
+                return result
 
         # Fallback to date-only parsing
         result = parse_natural_language_date(date_expr)
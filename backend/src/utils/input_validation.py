@@ -4,6 +4,7 @@ Input validation and sanitization utilities.
 Prevents prompt injection, SQL injection, and other malicious inputs.
 """
 import re
+import string
 from typing import Optional
 
 
@@ -12,6 +13,44 @@ class InputValidationError(Exception):
     pass
 
 
+# Basic prompt-injection detection patterns, combined into a single
+# alternation compiled at import so one regex pass covers them all.
+_SUSPICIOUS_PATTERNS = [
+    r"ignore\s+(all\s+)?(previous|above|prior)\s+(instructions|prompts?|rules?)",
+    r"system\s*:\s*you\s+are",
+    r"assistant\s*:\s*",
+    r"new\s+instructions?\s*:",
+    r"forget\s+(everything|all|your)",
+    r"disregard\s+(previous|all|your)",
+    r"override\s+(previous|all|your)",
+]
+_SUSPICIOUS = re.compile(
+    "|".join(f"(?:{p})" for p in _SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+
+# Error-message scrubbing patterns, compiled once
+_PATH_RE = re.compile(r'[A-Za-z]:[\\\/][^\s]*')
+_IP_RE = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+# Characters allowed through sanitization: word chars, whitespace, and the
+# punctuation whitelisted in _DISALLOWED. For ASCII input a str.translate
+# with this delete table is a single C loop — far cheaper than the regex
+# engine. Non-ASCII input falls back to the regex, whose \w/\s classes are
+# Unicode-aware (keeps accented letters, drops emoji etc.).
+_DISALLOWED = re.compile(r'[^\w\s\-.,!?;:()\[\]\'\"@#$%&*+=/<>]')
+_KEEP_ASCII = frozenset(
+    string.ascii_letters + string.digits + '_'
+    + string.whitespace
+    + '-.,!?;:()[]\'"@#$%&*+=/<>'
+)
+_ASCII_DELETE = {cp: None for cp in range(128) if chr(cp) not in _KEEP_ASCII}
+
+# Control characters below 0x20 other than \n, \r, \t. Detecting them via
+# translate (does deleting them change the length?) runs in C instead of
+# one bytecode iteration per character.
+_CTRL_DELETE = {cp: None for cp in range(32) if chr(cp) not in '\n\r\t'}
+
+
 def sanitize_chat_message(message: str, max_length: int = 5000) -> str:
     """
     Sanitize chat message to prevent prompt injection and abuse.
@@ -37,36 +76,29 @@ def sanitize_chat_message(message: str, max_length: int = 5000) -> str:
         raise InputValidationError("Message cannot be empty.")
 
     # Check for suspicious patterns (basic prompt injection detection)
-    suspicious_patterns = [
-        r"(?i)ignore\s+(all\s+)?(previous|above|prior)\s+(instructions|prompts?|rules?)",
-        r"(?i)system\s*:\s*you\s+are",
-        r"(?i)assistant\s*:\s*",
-        r"(?i)new\s+instructions?\s*:",
-        r"(?i)forget\s+(everything|all|your)",
-        r"(?i)disregard\s+(previous|all|your)",
-        r"(?i)override\s+(previous|all|your)",
-    ]
-
-    for pattern in suspicious_patterns:
-        if re.search(pattern, message):
-            raise InputValidationError(
-                "Message contains suspicious patterns. Please rephrase your request."
-            )
+    if _SUSPICIOUS.search(message):
+        raise InputValidationError(
+            "Message contains suspicious patterns. Please rephrase your request."
+        )
 
     # Check for excessive special characters (potential injection attempt)
-    special_char_ratio = sum(1 for c in message if not c.isalnum() and not c.isspace()) / len(message)
-    if special_char_ratio > 0.5:
+    special_chars = sum(1 for c in message if not c.isalnum() and not c.isspace())
+    if special_chars / len(message) > 0.5:
         raise InputValidationError(
             "Message contains too many special characters. Please use normal text."
         )
 
-    # Check for control characters
-    if any(ord(c) < 32 and c not in '\n\r\t' for c in message):
+    # Check for control characters: if deleting them changes the length,
+    # at least one was present.
+    if len(message.translate(_CTRL_DELETE)) != len(message):
         raise InputValidationError("Message contains invalid control characters.")
 
     # Remove potentially problematic characters but allow normal punctuation
     # Keep: letters, numbers, spaces, common punctuation
-    sanitized = re.sub(r'[^\w\s\-.,!?;:()\[\]\'\"@#$%&*+=/<>]', '', message)
+    if message.isascii():
+        sanitized = message.translate(_ASCII_DELETE)
+    else:
+        sanitized = _DISALLOWED.sub('', message)
 
     return sanitized.strip()
 
@@ -110,15 +142,19 @@ def sanitize_error_message(error_message: str) -> str:
     Returns:
         Safe error message for user display
     """
-    # Remove file paths
-    sanitized = re.sub(r'[A-Za-z]:[\\\/][^\s]*', '[path]', error_message)
+    # Remove stack traces — short-circuit before any substitution work
+    if 'Traceback' in error_message or 'File "' in error_message:
+        return "An internal error occurred. Please try again."
 
-    # Remove IP addresses
-    sanitized = re.sub(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', '[ip]', sanitized)
+    sanitized = error_message
 
-    # Remove stack traces
-    if 'Traceback' in sanitized or 'File "' in sanitized:
-        return "An internal error occurred. Please try again."
+    # Remove file paths (a drive path always contains ':')
+    if ':' in sanitized:
+        sanitized = _PATH_RE.sub('[path]', sanitized)
+
+    # Remove IP addresses (always contain '.')
+    if '.' in sanitized:
+        sanitized = _IP_RE.sub('[ip]', sanitized)
 
     # Truncate very long error messages
     if len(sanitized) > 200:
@@ -3,12 +3,26 @@ Performance logging utilities for monitoring response times and tool calls.
 
 Tracks latency, tool execution times, and provides metrics for optimization.
 """
+import atexit
+import queue
+import threading
 import time
+from collections import deque
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
 from typing import Optional, Dict, Any
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import partial
 import json
 
+# Pre-bound compact encoder: separators skip the default ", "/": " padding
+# (fewer bytes written) and default=str keeps odd argument values from
+# blowing up the audit path; binding once avoids the per-call attribute
+# lookup and keyword re-parsing.
+_json_encode = partial(json.dumps, separators=(',', ':'), default=str)
+
 
 class PerformanceMetrics:
     """Singleton for collecting performance metrics."""
@@ -18,12 +32,33 @@ class PerformanceMetrics:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.metrics = []
-            cls._instance.tool_metrics = []
+            # Per-thread bounded deques: each worker thread appends to its
+            # own buffer (no lock, no cache-line bouncing on a shared tail).
+            # Buffers are registered once per thread in _all_* lists, which
+            # the read-side methods merge on demand.
+            cls._instance._local = threading.local()
+            cls._instance._all_metric_buffers = []
+            cls._instance._all_tool_buffers = []
+            cls._instance._buffers_lock = threading.Lock()
             cls._instance.audit_log_enabled = True  # FR-019: Enable audit logging
             cls._instance.audit_log_path = "logs/agent_audit.log"  # FR-019: Log file path
+            # Audit writer state: queue + daemon thread created lazily on
+            # the first write so tool calls never block on disk I/O
+            cls._instance._audit_queue = None
+            cls._instance._audit_fh = None
+            cls._instance._audit_lock = threading.Lock()
         return cls._instance
 
+    def _thread_buffer(self, name: str, registry: list) -> deque:
+        """Get this thread's metric buffer, creating and registering it once."""
+        buf = getattr(self._local, name, None)
+        if buf is None:
+            buf = deque(maxlen=256)
+            setattr(self._local, name, buf)
+            with self._buffers_lock:
+                registry.append(buf)
+        return buf
+
     def log_chat_request(
         self,
         user_id: str,
@@ -47,7 +82,9 @@ class PerformanceMetrics:
             error: Error message if failed
         """
         metric = {
-            "timestamp": datetime.now().isoformat(),
+            # Integer nanoseconds: far cheaper than building and formatting
+            # a datetime per metric; converted to ISO only when written out.
+            "timestamp_ns": time.time_ns(),
             "user_id": user_id,
             "message_length": message_length,
             "response_time_ms": response_time_ms,
@@ -56,11 +93,7 @@ class PerformanceMetrics:
             "success": success,
             "error": error
         }
-        self.metrics.append(metric)
-
-        # Keep only last 1000 metrics to prevent memory leak
-        if len(self.metrics) > 1000:
-            self.metrics = self.metrics[-1000:]
+        self._thread_buffer('metrics', self._all_metric_buffers).append(metric)
 
     def log_tool_call(
         self,
@@ -85,7 +118,7 @@ class PerformanceMetrics:
             user_id: User who initiated the tool call (for auditing)
         """
         metric = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "tool_name": tool_name,
             "execution_time_ms": execution_time_ms,
             "success": success,
@@ -94,11 +127,7 @@ class PerformanceMetrics:
             "result_preview": str(result)[:200] if result else None,  # Truncate for memory
             "user_id": user_id  # FR-019: User attribution
         }
-        self.tool_metrics.append(metric)
-
-        # Keep only last 1000 tool metrics
-        if len(self.tool_metrics) > 1000:
-            self.tool_metrics = self.tool_metrics[-1000:]
+        self._thread_buffer('tool_metrics', self._all_tool_buffers).append(metric)
 
         # FR-019: Write to persistent log file for auditing (optional, configurable)
         self._write_to_audit_log(metric)
@@ -110,24 +139,56 @@ class PerformanceMetrics:
         Returns:
             Dictionary with performance statistics
         """
-        if not self.metrics:
+        with self._buffers_lock:
+            metric_buffers = list(self._all_metric_buffers)
+            tool_buffers = list(self._all_tool_buffers)
+
+        total = sum(len(buf) for buf in metric_buffers)
+        if not total:
             return {"message": "No metrics collected yet"}
 
-        response_times = [m["response_time_ms"] for m in self.metrics if m["success"]]
-        tool_times = [m["execution_time_ms"] for m in self.tool_metrics if m["success"]]
+        # Single pass over each buffer chain: accumulate counts, sum, and
+        # extrema together instead of walking the metrics five separate times.
+        successful = 0
+        streaming_requests = 0
+        response_times = []
+        rt_sum = 0.0
+        rt_min = float("inf")
+        rt_max = 0
+        for m in chain.from_iterable(metric_buffers):
+            if m["success"]:
+                successful += 1
+                rt = m["response_time_ms"]
+                response_times.append(rt)
+                rt_sum += rt
+                if rt < rt_min:
+                    rt_min = rt
+                if rt > rt_max:
+                    rt_max = rt
+            if m.get("streaming"):
+                streaming_requests += 1
+
+        total_tool_calls = 0
+        tool_time_sum = 0.0
+        tool_time_count = 0
+        for m in chain.from_iterable(tool_buffers):
+            total_tool_calls += 1
+            if m["success"]:
+                tool_time_sum += m["execution_time_ms"]
+                tool_time_count += 1
 
         return {
-            "total_requests": len(self.metrics),
-            "successful_requests": sum(1 for m in self.metrics if m["success"]),
-            "failed_requests": sum(1 for m in self.metrics if not m["success"]),
-            "avg_response_time_ms": sum(response_times) / len(response_times) if response_times else 0,
-            "max_response_time_ms": max(response_times) if response_times else 0,
-            "min_response_time_ms": min(response_times) if response_times else 0,
+            "total_requests": total,
+            "successful_requests": successful,
+            "failed_requests": total - successful,
+            "avg_response_time_ms": rt_sum / len(response_times) if response_times else 0,
+            "max_response_time_ms": rt_max if response_times else 0,
+            "min_response_time_ms": rt_min if response_times else 0,
             "p95_response_time_ms": sorted(response_times)[int(len(response_times) * 0.95)] if response_times else 0,
-            "total_tool_calls": len(self.tool_metrics),
-            "avg_tool_time_ms": sum(tool_times) / len(tool_times) if tool_times else 0,
-            "streaming_requests": sum(1 for m in self.metrics if m.get("streaming")),
-            "non_streaming_requests": sum(1 for m in self.metrics if not m.get("streaming"))
+            "total_tool_calls": total_tool_calls,
+            "avg_tool_time_ms": tool_time_sum / tool_time_count if tool_time_count else 0,
+            "streaming_requests": streaming_requests,
+            "non_streaming_requests": total - streaming_requests
         }
 
     def get_recent_metrics(self, limit: int = 100) -> list[Dict[str, Any]]:
@@ -140,7 +201,14 @@ class PerformanceMetrics:
         Returns:
             List of recent metrics
         """
-        return self.metrics[-limit:]
+        with self._buffers_lock:
+            metric_buffers = list(self._all_metric_buffers)
+        # Merge the per-thread buffers back into chronological order; each
+        # buffer is already ordered, so sort only the combined tail.
+        merged = sorted(
+            chain.from_iterable(metric_buffers), key=itemgetter("timestamp_ns")
+        )
+        return merged[-limit:] if limit < len(merged) else merged
 
     def _write_to_audit_log(self, metric: Dict[str, Any]):
         """
@@ -153,20 +221,64 @@ class PerformanceMetrics:
             return
 
         try:
-            import os
-            from pathlib import Path
+            if self._audit_queue is None:
+                self._start_audit_writer()
+            # Hand off to the background writer — no disk I/O on the
+            # request path
+            self._audit_queue.put(metric)
+        except Exception as e:
+            # Don't fail requests if logging fails, but print warning
+            print(f"Warning: Failed to write audit log: {e}")
+
+    def _start_audit_writer(self):
+        """Open the audit file and start the background writer thread once."""
+        with self._audit_lock:
+            if self._audit_queue is not None:
+                return
 
-            # Ensure logs directory exists
+            # Ensure logs directory exists (one syscall, not one per write)
             log_file = Path(self.audit_log_path)
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Append to audit log (JSON Lines format for easy parsing)
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(metric) + '\n')
-
-        except Exception as e:
-            # Don't fail requests if logging fails, but print warning
-            print(f"Warning: Failed to write audit log: {e}")
+            self._audit_fh = open(log_file, 'a', buffering=8192, encoding='utf-8')
+            atexit.register(self._audit_fh.close)
+
+            audit_queue = queue.SimpleQueue()
+            writer = threading.Thread(
+                target=self._audit_writer_loop,
+                name="audit-log-writer",
+                daemon=True,
+            )
+            self._audit_queue = audit_queue
+            writer.start()
+
+    def _audit_writer_loop(self):
+        """Drain queued metrics and write them in batches (JSON Lines)."""
+        while True:
+            lines = [self._format_audit_record(self._audit_queue.get())]
+            # Batch up whatever else is already queued
+            try:
+                while True:
+                    lines.append(
+                        self._format_audit_record(self._audit_queue.get_nowait())
+                    )
+            except queue.Empty:
+                pass
+
+            try:
+                self._audit_fh.writelines(lines)
+                self._audit_fh.flush()
+            except Exception as e:
+                print(f"Warning: Failed to write audit log: {e}")
+
+    @staticmethod
+    def _format_audit_record(metric: Dict[str, Any]) -> str:
+        """Render one metric as a JSON line with a human-readable timestamp."""
+        record = dict(metric)
+        record["timestamp"] = datetime.fromtimestamp(
+            record.pop("timestamp_ns") / 1e9
+        ).isoformat()
+        return _json_encode(record) + '\n'
 
 
 # Global performance metrics instance
@@ -192,11 +304,11 @@ async def measure_time(operation_name: str):
     """
     class Timer:
         def __init__(self):
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             self.elapsed_ms = 0
 
         def stop(self):
-            self.elapsed_ms = (time.time() - self.start_time) * 1000
+            self.elapsed_ms = (time.perf_counter() - self.start_time) * 1000
 
     timer = Timer()
     try:
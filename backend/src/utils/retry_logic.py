@@ -4,8 +4,9 @@ Retry logic with exponential backoff for OpenAI API calls.
 Handles transient failures gracefully with configurable retry parameters.
 """
 import asyncio
+import random
 import time
-from typing import Callable, TypeVar, Any
+from typing import Callable, Optional, TypeVar, Any
 from functools import wraps
 
 T = TypeVar('T')
@@ -18,24 +19,32 @@ class RetryError(Exception):
 
 async def retry_with_exponential_backoff(
     func: Callable[..., T],
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    *,
     max_retries: int = 3,
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     jitter: bool = True,
-    retryable_exceptions: tuple = (Exception,)
+    retryable_exceptions: tuple = (Exception,),
+    delays: Optional[tuple] = None
 ) -> T:
     """
     Retry an async function with exponential backoff.
 
     Args:
         func: Async function to retry
+        args: Positional arguments forwarded to func
+        kwargs: Keyword arguments forwarded to func
         max_retries: Maximum number of retry attempts
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff (e.g., 2 means 1s, 2s, 4s, 8s...)
         jitter: Add random jitter to prevent thundering herd
         retryable_exceptions: Tuple of exceptions that should trigger retry
+        delays: Optional precomputed per-attempt delay schedule; when given,
+            it replaces the exponential computation (used by with_retry)
 
     Returns:
         Result from successful function call
@@ -43,13 +52,14 @@ async def retry_with_exponential_backoff(
     Raises:
         RetryError: If all retry attempts are exhausted
     """
-    import random
+    if kwargs is None:
+        kwargs = {}
 
     last_exception = None
 
     for attempt in range(max_retries + 1):
         try:
-            return await func()
+            return await func(*args, **kwargs)
         except retryable_exceptions as e:
             last_exception = e
 
@@ -58,12 +68,13 @@ async def retry_with_exponential_backoff(
                     f"Failed after {max_retries} retries: {str(e)}"
                 ) from e
 
-            # Calculate delay with exponential backoff
-            delay = min(initial_delay * (exponential_base ** attempt), max_delay)
-
-            # Add jitter
-            if jitter:
-                delay = delay * (0.5 + random.random())
+            # Exponential backoff with optional jitter in one expression;
+            # a precomputed schedule skips the pow + min entirely
+            base_delay = (
+                delays[attempt] if delays is not None
+                else min(initial_delay * (exponential_base ** attempt), max_delay)
+            )
+            delay = base_delay * ((0.5 + random.random()) if jitter else 1.0)
 
             print(f"Retry attempt {attempt + 1}/{max_retries} after {delay:.2f}s: {str(e)}")
             await asyncio.sleep(delay)
@@ -95,18 +106,26 @@ def with_retry(
     Returns:
         Decorated function with retry logic
     """
+    # Parameters are fixed at decoration time, so the per-attempt delay
+    # schedule can be computed once instead of on every retry
+    delays = tuple(
+        min(initial_delay * (exponential_base ** i), max_delay)
+        for i in range(max_retries)
+    )
+
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            async def call_func():
-                return await func(*args, **kwargs)
-
+            # Forward args directly — no per-call closure allocation
             return await retry_with_exponential_backoff(
-                call_func,
+                func,
+                args,
+                kwargs,
                 max_retries=max_retries,
                 initial_delay=initial_delay,
                 max_delay=max_delay,
-                exponential_base=exponential_base
+                exponential_base=exponential_base,
+                delays=delays
             )
         return wrapper
     return decorator
@@ -5,130 +5,221 @@ This module provides functions to validate if user messages are within the scope
 of the todo application before processing them with the AI agent.
 """
 import re
+from enum import IntEnum
+from functools import lru_cache
 from typing import Tuple
 
+# Optional accelerator: google-re2 compiles to a linear-time DFA (no
+# backtracking, immune to pathological inputs) and these alternations use
+# only literals, groups, and \b anchors — all within RE2's subset. The
+# stdlib engine remains the default; re2 is picked up only if installed.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# All patterns are compiled once at import, with each category merged into
+# a single alternation so it is tested in one C-level search call instead
+# of one Python re.search round-trip per pattern.
+
+# Patterns that indicate the message is within scope. Gaps between
+# anchored words use .{0,80}? instead of .*: natural chat keeps the
+# action and its noun well within 80 characters, and the bound removes
+# the unbounded backtracking budget on adversarial input
+_IN_SCOPE_PATTERNS = (
+    # Task management actions
+    r'\b(add|create|new|make)\b.{0,80}?\b(task|todo|to-do|item|note|reminder)\b',
+    r'\b(list|show|view|display|get|fetch|find|search|look for)\b.{0,80}?\b(task|todo|to-do|item|note|reminder)\b',
+    r'\b(update|edit|change|modify|revise)\b.{0,80}?\b(task|todo|to-do|item|note|reminder)\b',
+    r'\b(delete|remove|kill|trash|cancel)\b.{0,80}?\b(task|todo|to-do|item|note|reminder)\b',
+    r'\b(complete|finish|done|mark as done|check|tick)\b.{0,80}?\b(task|todo|to-do|item|note|reminder)\b',
+    r'\b(task|todo|to-do|item|note|reminder)\b',
+
+    # Specific task-related terms
+    r'\b(priority|high|medium|low|urgent|important)\b',
+    r'\b(tag|category|label|type)\b',
+    r'\b(due|deadline|when|schedule|plan)\b',
+    r'\b(recurrence|recurring|repeat|daily|weekly|monthly)\b',
+
+    # Common task management phrases
+    r'\b(what.{0,80}?to do|what.{0,80}?on my list|what.{0,80}?need to do|what.{0,80}?on my plate)\b',
+    r'\b(my tasks|my todos|my list|my reminders)\b',
+    r'\b(add.{0,80}?to.{0,80}?list|put.{0,80}?on.{0,80}?list|remind me to)\b',
+    r'\b(have.{0,80}?to do|need.{0,80}?to do|should.{0,80}?do|must.{0,80}?do)\b',
+    r'(show me my tasks|show tasks|list my tasks|what tasks)',
+)
+_IN_SCOPE_RE = _re_engine.compile("|".join(f"(?:{p})" for p in _IN_SCOPE_PATTERNS))
+
+# Time/date patterns that only count when they appear in a task context.
+# Both former lists (time-in-task-context and time/date-near-task-words)
+# describe the same signal, so they share one combined alternation and the
+# function makes exactly one search call for the whole category.
+_TIME_CONTEXT_RE = _re_engine.compile("|".join(f"(?:{p})" for p in (
+    r'\bdue date\b', r'\bdue time\b', r'\bset time\b', r'\bset date\b', r'\bat time\b', r'\bon date\b',
+    r'\bschedule for\b', r'\bplan for\b', r'\btask time\b', r'\breminder time\b', r'\bdeadline\b',
+    r'\bwhen due\b', r'\bdue when\b', r'\btime for task\b', r'\bdate for task\b',
+    r'\btime for\b', r'\bdate for\b', r'\btime to\b', r'\bdate to\b', r'\btime task\b', r'\bdate task\b',
+    r'\btask date\b', r'\btodo time\b', r'\btodo date\b', r'\breminder date\b',
+)))
+
+# Keyword fallbacks as frozensets, checked against the message's word
+# tokens with a single hash intersection instead of one substring scan per
+# keyword. Action words must combine with task-related words to count.
+_ACTION_KEYWORDS = frozenset({
+    'add', 'create', 'new', 'make', 'list', 'show', 'view', 'update', 'edit',
+    'change', 'delete', 'remove', 'complete', 'finish', 'done', 'mark', 'get', 'find',
+})
+
+# Be more specific about task-related keywords to avoid false positives:
+# standalone time/date words are excluded, and 'work'/'project' need the
+# multi-word contexts below.
+_TASK_KEYWORDS_SPECIFIC = frozenset({
+    'task', 'todo', 'item', 'note', 'reminder', 'list', 'add', 'create',
+    'delete', 'update', 'complete', 'finish', 'done', 'priority', 'tag', 'category',
+    'schedule', 'plan', 'work', 'project',
+})
+
+# Multi-word phrases, merged into one escaped-literal alternation so the
+# whole set is matched in a single scan of the message (sre factors the
+# shared "work "/"project " prefixes into a trie-like program, giving the
+# one-pass multi-string matching an Aho-Corasick automaton would)
+_WORK_PROJECT_RE = _re_engine.compile('|'.join(map(re.escape, (
+    'work task', 'work todo', 'work item', 'project task', 'project todo',
+    'work list', 'project list', 'project item',
+))))
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Invariant reason strings: the in-scope reason is one interned constant
+# returned by identity, the out-of-scope template is formatted with the
+# original message only when someone asks for the text
+_IN_SCOPE_REASON = "Message is within the scope of the todo application."
+_OUT_OF_SCOPE_REASON = (
+    "Your message '{}' is not relevant to the scope of this application. "
+    "This application is designed specifically for managing todo tasks. "
+    "Please ask questions or provide commands related to creating, listing, "
+    "updating, or managing your tasks."
+)
+
+
+class ReasonCode(IntEnum):
+    """Why a message was judged in or out of scope.
+
+    Members are singletons, so the hot verdict path hands back a shared
+    object instead of allocating a reason string per call.
+    """
 
-def is_message_in_scope(message: str) -> Tuple[bool, str]:
+    IN_SCOPE = 0
+    EMPTY = 1
+    OUT_OF_SCOPE = 2
+
+
+# EMPTY deliberately shares the out-of-scope template so the user-facing
+# text is identical to what the fall-through path always produced
+REASON_TEXT = {
+    ReasonCode.IN_SCOPE: _IN_SCOPE_REASON,
+    ReasonCode.EMPTY: _OUT_OF_SCOPE_REASON,
+    ReasonCode.OUT_OF_SCOPE: _OUT_OF_SCOPE_REASON,
+}
+
+
+def scope_reason_text(code: ReasonCode, message: str = "") -> str:
+    """Render a ReasonCode as the user-facing reason string.
+
+    Args:
+        code: Verdict code from check_message_scope
+        message: Original message, interpolated into out-of-scope text
+
+    Returns:
+        Human-readable reason string
+    """
+    text = REASON_TEXT[code]
+    return text if code is ReasonCode.IN_SCOPE else text.format(message)
+
+
+# Cap matching to the first 2000 characters: no real chat message is
+# longer, and it bounds worst-case regex runtime on pathological input
+_MAX_MATCH_LENGTH = 2000
+
+
+@lru_cache(maxsize=1024)
+def check_message_scope(message: str) -> Tuple[bool, ReasonCode]:
     """
     Check if a message is within the scope of the todo application.
 
+    Returns a ReasonCode instead of a formatted string, so the hot path
+    allocates nothing: both the bool and the code are shared singletons.
+    Results are memoized: the function is pure over its input, and chat
+    users resend the same short prompts often enough that a repeat lookup
+    should not re-run the regex cascade.
+
     Args:
         message: User's message to validate
 
     Returns:
-        Tuple of (is_in_scope: bool, reason: str)
-        - is_in_scope: True if message is relevant to todo tasks, False otherwise
-        - reason: Explanation of why the message is in/out of scope
+        Tuple of (is_in_scope: bool, reason: ReasonCode)
     """
-    # Convert to lowercase for case-insensitive matching
-    message_lower = message.lower().strip()
-
-    # Define patterns that indicate the message is within scope
-    in_scope_patterns = [
-        # Task management actions
-        r'\b(add|create|new|make)\b.*\b(task|todo|to-do|item|note|reminder)\b',
-        r'\b(list|show|view|display|get|fetch|find|search|look for)\b.*\b(task|todo|to-do|item|note|reminder)\b',
-        r'\b(update|edit|change|modify|revise)\b.*\b(task|todo|to-do|item|note|reminder)\b',
-        r'\b(delete|remove|kill|trash|cancel)\b.*\b(task|todo|to-do|item|note|reminder)\b',
-        r'\b(complete|finish|done|mark as done|check|tick)\b.*\b(task|todo|to-do|item|note|reminder)\b',
-        r'\b(task|todo|to-do|item|note|reminder)\b',
-
-        # Specific task-related terms
-        r'\b(priority|high|medium|low|urgent|important)\b',
-        r'\b(tag|category|label|type)\b',
-        r'\b(due|deadline|when|schedule|plan)\b',
-        r'\b(recurrence|recurring|repeat|daily|weekly|monthly)\b',
-
-        # Common task management phrases
-        r'\b(what.*to do|what.*on my list|what.*need to do|what.*on my plate)\b',
-        r'\b(my tasks|my todos|my list|my reminders)\b',
-        r'\b(add.*to.*list|put.*on.*list|remind me to)\b',
-        r'\b(have.*to do|need.*to do|should.*do|must.*do)\b',
-        r'(show me my tasks|show tasks|list my tasks|what tasks)',
-    ]
-
-    # Define patterns that indicate the message is out of scope
-    out_of_scope_patterns = [
-        # General conversation starters that are not task-related
-        r'\b(hello|hi|hey|greetings|good morning|good afternoon|good evening|good night)\b',
-        r'\b(how are you|how do you do|how are things|what.*up)\b',
-        r'\b(who are you|what are you|tell me about yourself|what can you do)\b',
-        r'\b(tell me a joke|make me laugh|funny|joke|comedy)\b',
-        r'\b(weather|temperature|forecast|rain|snow|sunny|cloudy)\b',
-        r'\b(news|current events|politics|sports|entertainment|movie|film|book|music)\b',
-        r'\b(math|calculate|mathematics|equation|formula)\b',
-        r'\b(translate|translation|language|speak|linguistics)\b',
-        r'\b(code|programming|software|development|computer|tech|technology)\b',
-        r'\b(food|recipe|cooking|restaurant|meal|dinner|lunch|breakfast)\b',
-        r'\b(travel|vacation|trip|flight|hotel|destination|sightseeing)\b',
-        r'\b(health|medical|doctor|medicine|treatment|symptom|disease)\b',
-        r'\b(relationship|love|family|friend|marriage|dating)\b',
-        r'\b(money|finance|bank|account|payment|price|cost|expensive|cheap)\b',
-        r'\b(game|play|fun|entertainment|movie|tv|television|series|stream|watch)\b',
-        r'\b(philosophy|meaning|life|existential|deep|thought|think|reason|purpose)\b',
-    ]
-
-    # Check if the message matches any in-scope patterns first
-    for pattern in in_scope_patterns:
-        if re.search(pattern, message_lower):
-            return True, "Message is within the scope of the todo application."
-
-    # Check for task-related keywords but only if they appear in a task-related context
-    # Avoid matching generic phrases that just happen to contain task-related words
-    task_keywords = [
-        'task', 'todo', 'to-do', 'item', 'note', 'reminder', 'list', 'add', 'create',
-        'delete', 'update', 'complete', 'finish', 'done', 'due', 'date', 'time',
-        'priority', 'tag', 'category', 'schedule', 'plan', 'work', 'project'
-    ]
+    # Degenerate inputs bail before any normalization: isspace() is a
+    # C-level scan that allocates nothing, unlike strip()
+    if not message or message.isspace():
+        return False, ReasonCode.EMPTY
+
+    # Normalize once for case-insensitive matching: strip before lower so
+    # the second pass runs on the trimmed string. Every search below reuses
+    # this one normalized object, and the lru_cache means a given message
+    # is only ever normalized once.
+    message_lower = message.strip().lower()
+    if len(message_lower) > _MAX_MATCH_LENGTH:
+        message_lower = message_lower[:_MAX_MATCH_LENGTH]
+
+    # Cheapest signal first: tokenize once and check the keyword sets
+    # before any regex runs. Common in-scope messages ("show my tasks")
+    # satisfy action + task-word and skip the alternation entirely; either
+    # path returns the identical in-scope tuple, so ordering is free.
+    tokens = set(_TOKEN_RE.findall(message_lower))
 
     # Only consider it in scope if the message contains action words combined with task-related words
-    action_keywords = ['add', 'create', 'new', 'make', 'list', 'show', 'view', 'update', 'edit',
-                      'change', 'delete', 'remove', 'complete', 'finish', 'done', 'mark', 'get', 'find']
+    has_action = not _ACTION_KEYWORDS.isdisjoint(tokens)
 
-    has_action = any(action in message_lower for action in action_keywords)
+    # For due dates and times, require more context to avoid false positives
+    has_task_related = not _TASK_KEYWORDS_SPECIFIC.isdisjoint(tokens)
 
-    # Be more specific about task-related keywords to avoid false positives
-    # Exclude standalone time/date words that aren't in a task context
-    task_keywords_specific = [
-        'task', 'todo', 'to-do', 'item', 'note', 'reminder', 'list', 'add', 'create',
-        'delete', 'update', 'complete', 'finish', 'done', 'priority', 'tag', 'category',
-        'schedule', 'plan', 'work', 'project'
-    ]
+    if has_action and has_task_related:
+        return True, ReasonCode.IN_SCOPE
 
-    # For due dates and times, require more context to avoid false positives
-    has_task_related = any(keyword in message_lower for keyword in task_keywords_specific)
+    # Then the in-scope pattern alternation
+    if _IN_SCOPE_RE.search(message_lower):
+        return True, ReasonCode.IN_SCOPE
 
     # Check for time/date in task context specifically
-    # Using word boundaries to avoid partial matches in other phrases
-    time_context_patterns = [
-        r'\bdue date\b', r'\bdue time\b', r'\bset time\b', r'\bset date\b', r'\bat time\b', r'\bon date\b',
-        r'\bschedule for\b', r'\bplan for\b', r'\btask time\b', r'\breminder time\b', r'\bdeadline\b',
-        r'\bwhen due\b', r'\bdue when\b', r'\btime for task\b', r'\bdate for task\b'
-    ]
-    has_time_context = any(re.search(pattern, message_lower) for pattern in time_context_patterns)
-
-    # Check if 'time' or 'date' appear in the context of tasks specifically
-    # Using word boundaries to avoid partial matches in other phrases
-    time_date_context_patterns = [
-        r'\btime for\b', r'\bdate for\b', r'\btime to\b', r'\bdate to\b', r'\btime task\b', r'\bdate task\b',
-        r'\btask time\b', r'\btask date\b', r'\btodo time\b', r'\btodo date\b',
-        r'\breminder time\b', r'\breminder date\b'
-    ]
-    has_time_date_in_task_context = any(re.search(pattern, message_lower) for pattern in time_date_context_patterns)
+    has_time_context = bool(_TIME_CONTEXT_RE.search(message_lower))
 
     # For 'work' and 'project', require more context to avoid false positives
-    has_work_project_context = any(context in message_lower for context in [
-        'work task', 'work todo', 'work item', 'project task', 'project todo',
-        'work list', 'project list', 'work item', 'project item'
-    ])
+    has_work_project_context = bool(_WORK_PROJECT_RE.search(message_lower))
+
+    if has_time_context or has_work_project_context:
+        return True, ReasonCode.IN_SCOPE
+
+    # No in-scope signal found, so it's out of scope
+    return False, ReasonCode.OUT_OF_SCOPE
 
-    if (has_action and has_task_related) or has_time_context or has_time_date_in_task_context or has_work_project_context:
-        return True, "Message is within the scope of the todo application."
 
-    # Check if the message matches any out-of-scope patterns only if no in-scope patterns matched
-    for pattern in out_of_scope_patterns:
-        if re.search(pattern, message_lower):
-            return False, f"Your message '{message}' is not relevant to the scope of this application. This application is designed specifically for managing todo tasks. Please ask questions or provide commands related to creating, listing, updating, or managing your tasks."
+@lru_cache(maxsize=1024)
+def is_message_in_scope(message: str) -> Tuple[bool, str]:
+    """
+    Check if a message is within the scope of the todo application.
+
+    String-returning wrapper over check_message_scope for callers that
+    surface the reason to the user; hot-path callers that only branch on
+    the verdict should use check_message_scope directly.
 
-    # If no patterns match, it's likely out of scope
-    return False, f"Your message '{message}' is not relevant to the scope of this application. This application is designed specifically for managing todo tasks. Please ask questions or provide commands related to creating, listing, updating, or managing your tasks."
\ No newline at end of file
+    Args:
+        message: User's message to validate
+
+    Returns:
+        Tuple of (is_in_scope: bool, reason: str)
+        - is_in_scope: True if message is relevant to todo tasks, False otherwise
+        - reason: Explanation of why the message is in/out of scope
+    """
+    in_scope, code = check_message_scope(message)
+    return in_scope, scope_reason_text(code, message)
@@ -0,0 +1,212 @@
+"""
+Pytest configuration and fixtures for backend tests.
+
+Provides common fixtures used across all test modules.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the backend root to the path so ``src.*`` imports resolve no matter
+# which directory pytest is invoked from. Inserting backend/src instead
+# would shadow the installed openai-agents ``agents`` distribution with
+# the local src/agents package.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# uvicorn[standard] ships uvloop and the server picks it up automatically;
+# use the same loop for the test suite so async tests run on what
+# production runs on (and schedule faster). Falls back to the stdlib loop
+# where uvloop isn't available (e.g. Windows).
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Keep auth tests deterministic: drop JWKS and token caches around each test."""
+    from src.auth.jwks import clear_jwks_cache
+
+    def _clear():
+        clear_jwks_cache()
+        # Only clear the token caches if a test already pulled in the
+        # dependencies module; importing it here would load the whole
+        # auth stack for every test.
+        dependencies = sys.modules.get("src.auth.dependencies")
+        if dependencies is not None:
+            dependencies.clear_token_caches()
+
+    _clear()
+    yield
+    _clear()
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole suite instead of one per async test."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application, imported once for the whole suite.
+
+    Importing src.main reaches the DB engine module, which raises
+    RuntimeError when DATABASE_URL is unset — catch that alongside
+    ImportError so app-dependent tests skip rather than error in
+    environments without the server's runtime configuration.
+    AttributeError covers the case where src/agents shadows the
+    openai-agents ``agents`` distribution (src on sys.path).
+    """
+    try:
+        from src.main import app as fastapi_app
+    except (ImportError, RuntimeError, AttributeError) as exc:
+        pytest.skip(f"src.main not importable here: {exc}")
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+async def client(app):
+    """Session-scoped async client speaking ASGI directly.
+
+    httpx.AsyncClient with ASGITransport calls the app in-process on the
+    test's own event loop, skipping the background-thread portal that
+    TestClient sets up for every request.
+    """
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def route_paths(app):
+    """Frozenset of registered route paths, built once for the suite."""
+    return frozenset(r.path for r in app.routes)
+
+
+@pytest.fixture(scope="session")
+def sync_client(app):
+    """Legacy TestClient, kept for one smoke test of the sync path."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def _mock_session_template():
+    """Build the mock session exactly once, spec'd against the real one.
+
+    TaskRepository runs on a plain sync Session (session.execute and
+    friends are not awaited), so the mock must be a MagicMock — an
+    AsyncMock would hand back coroutines that the repository never
+    awaits. The spec keeps typos from silently creating child mocks.
+    """
+    from sqlmodel import Session
+
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def mock_session(_mock_session_template):
+    """
+    Mock sync database session.
+
+    Mock construction is expensive enough to matter across the suite,
+    so each test gets the session-scoped template wiped clean (call history,
+    return values, and side effects) rather than a freshly built mock.
+    """
+    _mock_session_template.reset_mock(return_value=True, side_effect=True)
+    return _mock_session_template
+
+
+@pytest.fixture
+def auth_env(monkeypatch):
+    """Arrange the env vars verify_jwt_token requires."""
+    monkeypatch.setenv("BETTER_AUTH_ISSUER", "http://localhost:3000")
+    monkeypatch.setenv("API_AUDIENCE", "http://localhost:8000")
+    monkeypatch.setenv("BETTER_AUTH_JWKS_URL", "http://localhost:3000/api/auth/jwks")
+
+
+@pytest.fixture
+def mock_jwks():
+    """Mock JWKS response for testing."""
+    return {
+        "keys": [
+            {
+                "kid": "test-key-1",
+                "kty": "OKP",
+                "crv": "Ed25519",
+                "x": "test-x-value",
+                "y": "test-y-value",
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def valid_token_payload():
+    """Mock valid JWT payload."""
+    return {
+        "sub": "user-123",
+        "email": "test@example.com",
+        "iss": "http://localhost:3000",
+        "aud": "http://localhost:8000",
+    }
+
+
+@pytest.fixture
+def expired_token_payload():
+    """Mock expired JWT payload."""
+    from datetime import datetime, timezone, timedelta
+
+    return {
+        "sub": "user-123",
+        "email": "test@example.com",
+        "iss": "http://localhost:3000",
+        "aud": "http://localhost:8000",
+        "exp": int((datetime.now(timezone.utc) - timedelta(hours=1)).timestamp()),
+        "iat": int((datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()),
+    }
+
+
+@pytest.fixture
+def mock_task():
+    """Mock Task model instance.
+
+    SimpleNamespace instead of MagicMock: consumers only read attributes,
+    so this skips mock introspection and surfaces typos as AttributeError
+    rather than silently auto-creating child mocks.
+    """
+    return SimpleNamespace(
+        id=1,
+        user_id=123,
+        title="Test Task",
+        description="Test Description",
+        completed=False,
+        created_at="2025-12-29T10:00:00Z",
+        updated_at=None,
+    )
+
+
+@pytest.fixture
+def mock_user():
+    """Mock User model instance."""
+    return SimpleNamespace(
+        id=123,
+        email="test@example.com",
+        password_hash="$2b$12$hash",
+        created_at="2025-12-29T10:00:00Z",
+    )
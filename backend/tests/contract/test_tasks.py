@@ -0,0 +1,275 @@
+"""
+Contract tests for task API endpoints.
+
+Tests CRUD operations for tasks with user isolation enforcement.
+These tests verify the contract between the frontend API client
+and the FastAPI backend task endpoints.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
+
+
+class TestTaskSchemas:
+    """Tests for task Pydantic schemas."""
+
+    def test_task_create_requires_title(self):
+        """Verify TaskCreate requires non-empty title."""
+        from src.schemas.task import TaskCreate
+
+        # Empty title should fail validation
+        with pytest.raises(ValueError):
+            TaskCreate(title="")
+
+    def test_task_create_with_valid_data(self):
+        """Verify TaskCreate accepts valid data."""
+        from src.schemas.task import TaskCreate
+
+        task = TaskCreate(title="Buy groceries", description="Milk and eggs")
+        assert task.title == "Buy groceries"
+        assert task.description == "Milk and eggs"
+
+    def test_task_create_defaults_description_to_empty(self):
+        """Verify TaskCreate defaults description to empty string."""
+        from src.schemas.task import TaskCreate
+
+        task = TaskCreate(title="Test task")
+        assert task.description == ""
+
+    def test_task_update_allows_partial_updates(self):
+        """Verify TaskUpdate allows partial updates."""
+        from src.schemas.task import TaskUpdate
+
+        # Only title provided
+        update = TaskUpdate(title="Updated title")
+        assert update.title == "Updated title"
+        assert update.description is None
+
+    def test_task_response_contains_all_fields(self):
+        """Verify TaskResponse contains expected fields."""
+        from src.models.task import TaskPriority
+        from src.schemas.task import TaskResponse
+        from datetime import datetime
+
+        task = TaskResponse(
+            id=1,
+            title="Test task",
+            description="Test description",
+            completed=False,
+            created_at=datetime.now(),
+            updated_at=None,
+            priority=TaskPriority.MEDIUM,
+            tags=[],
+        )
+        assert task.id == 1
+        assert task.title == "Test task"
+        assert task.completed is False
+        assert task.priority is TaskPriority.MEDIUM
+        assert task.tags == []
+
+
+class TestTaskRepository:
+    """Tests for task repository data access."""
+
+    def test_repository_stores_user_id(self):
+        """Verify TaskRepository stores the user_id from JWT."""
+        from src.repository.task_repository import TaskRepository
+
+        # Constructor never touches the session, so skip AsyncMock setup
+        repo = TaskRepository(object(), "user-123")
+
+        assert repo.user_id == "user-123"
+
+    def test_repository_create_task(self, mock_session):
+        """Verify create method adds task with correct user_id."""
+        from src.repository.task_repository import TaskRepository
+        from src.schemas.task import TaskCreate
+
+        repo = TaskRepository(mock_session, "456")
+
+        task = repo.create(TaskCreate(title="New task", description="Test"))
+
+        assert mock_session.add.called
+        assert task.user_id == "456"
+        assert task.title == "New task"
+
+    def test_repository_get_all_filters_by_user(self, mock_session):
+        """Verify get_all filters queries by user_id."""
+        from src.repository.task_repository import TaskRepository
+
+        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+
+        repo = TaskRepository(mock_session, "789")
+
+        assert repo.get_all() == []
+        statement = mock_session.execute.call_args[0][0]
+        assert statement.whereclause is not None
+
+
+class TestTaskService:
+    """Tests for task service business logic."""
+
+    def test_service_stores_user_id(self):
+        """Verify TaskService stores the user_id from JWT."""
+        from src.service.task_service import TaskService
+
+        # Constructor never touches the session, so skip AsyncMock setup
+        service = TaskService(object(), "jwt-user-123")
+
+        assert service.user_id == "jwt-user-123"
+        assert service.repository.user_id == "jwt-user-123"
+
+    def test_service_create_task_validates_empty_title(self):
+        """Verify create_task rejects empty title."""
+        from src.service.task_service import TaskService
+        from src.schemas.task import TaskCreate
+
+        # Validation raises before the session is touched, so a bare object works
+        service = TaskService(object(), "123")
+
+        # Empty title should raise ValueError
+        with pytest.raises(ValueError, match="Title cannot be empty"):
+            service.create_task(TaskCreate(title="   "))
+
+    def test_service_create_task_accepts_valid_title(self, mock_session, mock_task):
+        """Verify create_task accepts valid title."""
+        from src.service.task_service import TaskService
+        from src.schemas.task import TaskCreate
+
+        service = TaskService(mock_session, "123")
+        service.repository.create = MagicMock(return_value=mock_task)
+
+        result = service.create_task(TaskCreate(title="Valid task"))
+
+        assert result is not None
+
+
+class TestTaskAPIEndpoints:
+    """Tests for task API endpoint structure."""
+
+    @pytest.fixture(scope="class")
+    def router(self):
+        """The tasks router; importing it reaches the DB engine module,
+        which raises RuntimeError when DATABASE_URL is unset — skip
+        rather than error in environments without that configuration."""
+        try:
+            from src.api.tasks import router as tasks_router
+        except (ImportError, RuntimeError) as exc:
+            pytest.skip(f"src.api.tasks not importable here: {exc}")
+        return tasks_router
+
+    def test_tasks_router_registered(self, router):
+        """Verify tasks router is registered."""
+        assert router.prefix == ""
+        assert "/tasks" in router.prefix or router.prefix == ""
+
+    def test_list_tasks_endpoint_exists(self, router):
+        """Verify GET /api/tasks endpoint is defined."""
+        route_paths = [r.path for r in router.routes]
+        # Router uses "/" for list tasks (becomes /api/tasks/ when mounted)
+        assert any("/" == path for path in route_paths)
+
+    def test_create_task_endpoint_exists(self, router):
+        """Verify POST /api/tasks endpoint is defined."""
+        route_paths = [r.path for r in router.routes]
+        # Router uses "/" for create (POST)
+        assert any("/" == path for path in route_paths)
+
+    def test_get_task_endpoint_exists(self, router):
+        """Verify GET /api/tasks/{task_id} endpoint is defined."""
+        route_paths = [r.path for r in router.routes]
+        assert any("{task_id}" in path for path in route_paths)
+
+    def test_delete_task_endpoint_exists(self, router):
+        """Verify DELETE /api/tasks/{task_id} endpoint is defined."""
+        route_paths = [r.path for r in router.routes]
+        # Router uses "/{task_id}" for delete (DELETE)
+        assert any("/{task_id}" == path for path in route_paths)
+
+    def test_toggle_task_endpoint_exists(self, router):
+        """Verify POST /api/tasks/{task_id}/toggle endpoint is defined."""
+        route_paths = [r.path for r in router.routes]
+        assert any("toggle" in path.lower() for path in route_paths)
+
+
+class TestTaskUserIsolation:
+    """Tests for user isolation in task operations."""
+
+    def test_repository_filters_by_user_id_in_get_all(self, mock_session):
+        """Verify get_all includes user_id filter."""
+        from src.repository.task_repository import TaskRepository
+
+        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+
+        repo = TaskRepository(mock_session, "999")
+
+        repo.get_all()
+
+        # Verify execute was called
+        assert mock_session.execute.called
+
+    def test_repository_filters_by_user_id_in_get_by_id(self, mock_session):
+        """Verify get_by_id includes user_id filter."""
+        from src.repository.task_repository import TaskRepository
+
+        mock_session.execute.return_value.scalar_one_or_none.return_value = None
+
+        repo = TaskRepository(mock_session, "888")
+
+        repo.get_by_id(task_id=42)
+
+        # Verify execute was called with user filter
+        assert mock_session.execute.called
+
+    def test_repository_delete_verifies_ownership(self, mock_session):
+        """Verify delete only succeeds for owned tasks."""
+        from src.repository.task_repository import TaskRepository
+
+        # Task not found
+        mock_session.execute.return_value.scalar_one_or_none.return_value = None
+
+        repo = TaskRepository(mock_session, "777")
+
+        result = repo.delete(task_id=1)
+
+        # Should return False because task not found
+        assert result is False
+
+
+class TestTaskValidation:
+    """Tests for task validation rules."""
+
+    def test_title_max_length_200(self):
+        """Verify title cannot exceed 200 characters."""
+        from src.schemas.task import TaskCreate
+
+        # 201 character string should fail
+        long_title = "x" * 201
+        with pytest.raises(ValueError):
+            TaskCreate(title=long_title)
+
+    def test_description_max_length_2000(self):
+        """Verify description cannot exceed 2000 characters."""
+        from src.schemas.task import TaskCreate
+
+        # 2001 character string should fail
+        long_desc = "x" * 2001
+        with pytest.raises(ValueError):
+            TaskCreate(title="Valid title", description=long_desc)
+
+    def test_whitespace_only_title_rejected(self):
+        """Verify whitespace-only title is rejected at service level."""
+        from src.service.task_service import TaskService
+        from src.schemas.task import TaskCreate
+
+        # Validation raises before the session is touched, so a bare object works
+        service = TaskService(object(), "123")
+
+        # Service validates whitespace-only titles, not the schema
+        with pytest.raises(ValueError, match="Title cannot be empty"):
+            service.create_task(TaskCreate(title="   \t\n  "))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,184 @@
+"""
+Integration tests for authentication flow.
+
+Tests the complete authentication flow from JWT verification
+through to user-scoped API operations.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+class TestAppStructure:
+    """Tests for FastAPI app structure."""
+
+    def test_app_has_title(self, app):
+        """Verify app has correct title."""
+        assert "Todo Application API" in app.title
+
+    def test_app_has_version(self, app):
+        """Verify app has correct version."""
+        assert app.version == "2.0.0"
+
+    @pytest.mark.parametrize("path", ["/", "/api/health", "/api/tasks"])
+    def test_route_registered(self, route_paths, path):
+        """Verify the core endpoints (root, health, tasks) are registered."""
+        assert path in route_paths or any(path in p for p in route_paths)
+
+
+class TestEndpoints:
+    """Tests for endpoint existence and structure."""
+
+    def test_cors_middleware_configured(self, app):
+        """Verify CORS middleware is registered on the app."""
+        middleware_names = [m.cls.__name__ for m in app.user_middleware]
+        assert "CORSMiddleware" in middleware_names
+
+
+class TestJWKSEndpoint:
+    """Tests for JWKS endpoint behavior."""
+
+    def test_jwks_fetch_failure_handling(self):
+        """Verify JWKS fetch failures are handled gracefully."""
+        from src.auth.jwks import fetch_jwks, clear_jwks_cache
+        import httpx
+
+        # Clear both cache tiers to ensure fresh fetch
+        clear_jwks_cache()
+
+        with patch("src.auth.jwks._HTTPX.get") as mock_get, \
+                patch("src.auth.jwks.time.sleep"):
+            mock_get.side_effect = httpx.HTTPError("Connection refused")
+
+            with pytest.raises(RuntimeError):
+                fetch_jwks("http://localhost:3000/api/auth/jwks")
+
+            # Every retry attempt failed before the error surfaced
+            assert mock_get.call_count == 3
+
+
+@pytest.mark.usefixtures("auth_env")
+class TestTokenClaims:
+    """Tests for JWT token claim validation."""
+
+    def _verify(self, payload):
+        """Run verify_jwt_token with decode mocked to yield ``payload``."""
+        from src.auth.dependencies import verify_jwt_token
+
+        credentials = MagicMock()
+        credentials.credentials = "token-under-test"
+
+        # PyJWKClient is patched so no JWKS fetch leaves the process
+        with patch("src.auth.dependencies.PyJWKClient"), \
+                patch("src.auth.dependencies.jwt.decode") as mock_decode:
+            mock_decode.return_value = payload
+            return verify_jwt_token(credentials)
+
+    def test_token_claims_structure(self, valid_token_payload):
+        """Verify the verified payload carries the Better Auth claims."""
+        payload = self._verify(valid_token_payload)
+
+        # These claims should be present in tokens issued by Better Auth
+        for claim in ("sub", "email"):
+            assert claim in payload
+
+    def test_subject_claim_is_user_id(self, valid_token_payload):
+        """Verify get_current_user reads the 'sub' claim as the user ID."""
+        from src.auth.dependencies import get_current_user
+
+        payload = self._verify(valid_token_payload)
+        user_id = get_current_user(payload)
+
+        assert user_id == valid_token_payload["sub"]
+        assert isinstance(user_id, str)
+
+
+@pytest.mark.usefixtures("auth_env")
+class TestErrorHandling:
+    """Tests for authentication error handling."""
+
+    @pytest.fixture(scope="class")
+    def creds_factory(self):
+        """Build bearer-credential mocks from one class-scoped template.
+
+        MagicMock construction is slow enough under pytest to be worth
+        sharing; each call just rebinds the credentials attribute.
+        """
+        template = MagicMock()
+
+        def make(token):
+            template.credentials = token
+            return template
+
+        return make
+
+    def _assert_rejected(self, creds):
+        from src.auth.dependencies import verify_jwt_token, HTTPException
+
+        # PyJWKClient is patched so no JWKS fetch leaves the process
+        with patch("src.auth.dependencies.PyJWKClient"):
+            with pytest.raises(HTTPException) as exc_info:
+                verify_jwt_token(creds)
+
+        assert exc_info.value.status_code == 401
+
+    def test_invalid_token_format(self, creds_factory):
+        """Verify malformed tokens are rejected."""
+        import jwt
+
+        with patch("src.auth.dependencies.jwt.decode") as mock_decode:
+            # verify_jwt_token only catches jwt.InvalidTokenError, so the
+            # mock must raise the real exception type
+            mock_decode.side_effect = jwt.DecodeError("Not enough segments")
+            self._assert_rejected(creds_factory("not-a-valid-jwt-format"))
+
+    def test_tampered_token(self, creds_factory):
+        """Verify tampered tokens are rejected."""
+        import jwt
+
+        with patch("src.auth.dependencies.jwt.decode") as mock_decode:
+            mock_decode.side_effect = jwt.InvalidSignatureError(
+                "Signature verification failed"
+            )
+            self._assert_rejected(
+                creds_factory("eyJhbGciOiJFZERTQSJ9.tampered.eyJzdWIiOiIxMjM0NTY3ODkwIn0.signature")
+            )
+
+
+class TestAPIResponseStructure:
+    """Tests for API response structures."""
+
+    async def test_root_response_structure(self, client):
+        """Verify root endpoint returns expected structure."""
+        response = await client.get("/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "name" in data
+        assert "version" in data
+        assert "status" in data
+
+    async def test_health_response_structure(self, client):
+        """Verify health endpoint returns expected structure."""
+        response = await client.get("/api/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "status" in data
+
+
+class TestUserIsolationEnforcement:
+    """Tests for user isolation enforcement in API."""
+
+    def test_unauthenticated_request_to_tasks_returns_401(self, sync_client):
+        """Smoke test kept on the legacy TestClient sync path."""
+        response = sync_client.get("/api/tasks")
+
+        # Should return 401 or 403 for unauthenticated request
+        assert response.status_code in [401, 403]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,282 @@
+"""
+Integration tests for task creation and listing.
+
+Tests the complete task workflow from API request
+through database operation with user isolation.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+class TestTaskAPIIntegration:
+    """Integration tests for task API endpoints.
+
+    Uses the session-scoped async ``client`` fixture from conftest: requests
+    go straight through ASGITransport on the test event loop, with no
+    TestClient thread hop.
+    """
+
+    async def test_root_endpoint(self, client):
+        """Verify root endpoint returns API info."""
+        response = await client.get("/")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "Todo Application API"
+
+    async def test_health_endpoint(self, client):
+        """Verify health endpoint returns healthy status."""
+        response = await client.get("/api/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+    @pytest.mark.parametrize(
+        "method,path,body",
+        [
+            ("GET", "/api/tasks", None),
+            ("POST", "/api/tasks", {"title": "Test task"}),
+        ],
+    )
+    async def test_requires_auth(self, client, method, path, body):
+        """Verify task endpoints reject unauthenticated requests."""
+        response = await client.request(method, path, json=body)
+        # Should return 401 or 403 for unauthenticated request
+        assert response.status_code in [401, 403]
+
+
+class TestTaskEndpointsStructure:
+    """Tests for task endpoint structure."""
+
+    def test_all_task_routes_registered(self, route_paths):
+        """Verify all task endpoints are registered."""
+        # Check for task-related routes
+        has_tasks_list = "/api/tasks" in route_paths
+
+        assert has_tasks_list or any("tasks" in p for p in route_paths)
+
+
+class TestTaskServiceIntegration:
+    """Integration tests for task service."""
+
+    def test_create_and_list_workflow(self, mock_session, mock_task):
+        """Verify complete create and list workflow."""
+        from src.service.task_service import TaskService
+        from src.schemas.task import TaskCreate
+
+        service = TaskService(mock_session, "123")
+
+        # Stub repository methods; the SQL layer has its own tests
+        service.repository.create = MagicMock(return_value=mock_task)
+        service.repository.get_all = MagicMock(return_value=[mock_task])
+
+        # Create task
+        created = service.create_task(TaskCreate(title="Test task"))
+        assert created is not None
+
+        # List tasks
+        tasks = service.get_tasks()
+        assert len(tasks) == 1
+
+    def test_toggle_task_workflow(self, mock_session, mock_task):
+        """Verify task toggle workflow."""
+        from src.service.task_service import TaskService
+
+        service = TaskService(mock_session, "123")
+        service.repository.toggle = MagicMock(return_value=mock_task)
+
+        # Initially incomplete
+        assert mock_task.completed is False
+
+        # Toggle should work
+        result = service.toggle_task(1)
+        assert result is not None
+
+
+class TestUserIsolationIntegration:
+    """Integration tests for user isolation."""
+
+    def test_different_users_cannot_access_each_other_tasks(self):
+        """Verify user A cannot access user B's tasks."""
+        from sqlmodel import Session
+        from src.repository.task_repository import TaskRepository
+
+        # User A's session and repository
+        session_a = MagicMock(spec=Session)
+        repo_a = TaskRepository(session_a, "101")
+
+        # User B's session and repository
+        session_b = MagicMock(spec=Session)
+        repo_b = TaskRepository(session_b, "102")
+
+        # Both should store different user_ids
+        assert repo_a.user_id == "101"
+        assert repo_b.user_id == "102"
+
+        # Queries will use different user_id filters
+        # Even if same task_id, each user only sees their own
+        repo_a.get_by_id(task_id=1)
+        repo_b.get_by_id(task_id=1)
+
+        # Both execute calls should have been made
+        assert session_a.execute.called
+        assert session_b.execute.called
+
+        # The actual filtering happens in SQL via WHERE clauses
+        # This test verifies each repository is configured for its user
+
+
+class TestTaskDataIntegrity:
+    """Tests for task data integrity."""
+
+    def test_task_created_with_user_id(self, mock_session):
+        """Verify new tasks are created with the authenticated user's ID."""
+        from src.repository.task_repository import TaskRepository
+        from src.schemas.task import TaskCreate
+
+        user_id = "456"
+        repo = TaskRepository(mock_session, user_id)
+
+        task = repo.create(TaskCreate(title="My task"))
+
+        # Verify session.add was called (task was queued for add)
+        assert mock_session.add.called
+        assert task.user_id == user_id
+
+    def test_task_timestamps_set_on_create(self):
+        """Verify timestamps are set when task is created."""
+        from datetime import datetime, timezone
+        from src.models.task import Task
+
+        task = Task(
+            user_id=1,
+            title="Test task",
+            description=""
+        )
+
+        # created_at should be set
+        assert task.created_at is not None
+        assert task.created_at.tzinfo is not None  # Should be timezone-aware
+
+        # updated_at should be None initially
+        assert task.updated_at is None
+
+    def test_task_default_completed_is_false(self):
+        """Verify new tasks default to incomplete."""
+        from src.models.task import Task
+
+        task = Task(
+            user_id=1,
+            title="Test task",
+            description=""
+        )
+
+        assert task.completed is False
+
+
+# Canonical TaskResponse examples: Pydantic validation runs once at import
+# instead of inside every test. Variants are derived with model_copy,
+# which skips revalidation.
+def _make_task_responses():
+    from datetime import datetime
+    from src.models.task import TaskPriority
+    from src.schemas.task import TaskResponse
+
+    first = TaskResponse(
+        id=1,
+        title="Task 1",
+        description="",
+        completed=False,
+        created_at=datetime.now(),
+        updated_at=None,
+        priority=TaskPriority.MEDIUM,
+        tags=[],
+    )
+    second = first.model_copy(
+        update={
+            "id": 2,
+            "title": "Task 2",
+            "description": "Description",
+            "completed": True,
+            "updated_at": datetime.now(),
+        }
+    )
+    return first, second
+
+
+_TASK_R1, _TASK_R2 = _make_task_responses()
+
+
+class TestTaskAPIResponses:
+    """Tests for task API response formats."""
+
+    def test_list_response_format(self):
+        """Verify list tasks returns array."""
+        tasks = [_TASK_R1, _TASK_R2]
+
+        assert len(tasks) == 2
+        assert tasks[0].id == 1
+        assert tasks[1].completed is True
+
+    def test_create_response_contains_all_fields(self):
+        """Verify create response contains all task fields."""
+        response = _TASK_R1.model_copy(
+            update={"id": 42, "title": "New task", "description": "Task description"}
+        )
+
+        assert response.id == 42
+        assert response.title == "New task"
+        assert response.completed is False
+        # Note: user_id is intentionally excluded from response for security
+
+
+class TestTaskStateTransitions:
+    """Tests for task state transitions.
+
+    Toggling lives on TaskRepository, so these tests route through it
+    with the session mocked to return the task under test.
+    """
+
+    def _toggle(self, mock_session, task):
+        from src.repository.task_repository import TaskRepository
+
+        mock_session.execute.return_value.scalar_one_or_none.return_value = task
+        repo = TaskRepository(mock_session, task.user_id)
+        return repo.toggle(task_id=1)
+
+    def test_toggle_transitions_complete_to_incomplete(self, mock_session):
+        """Verify toggle changes completed to incomplete."""
+        from src.models.task import Task
+
+        task = Task(
+            user_id="1",
+            title="Test task",
+            completed=True  # Initially complete
+        )
+
+        # Toggle should change state
+        result = self._toggle(mock_session, task)
+
+        assert result is task
+        assert task.completed is False
+
+    def test_toggle_transitions_incomplete_to_complete(self, mock_session):
+        """Verify toggle changes incomplete to completed."""
+        from src.models.task import Task
+
+        task = Task(
+            user_id="1",
+            title="Test task",
+            completed=False  # Initially incomplete
+        )
+
+        # Toggle should change state
+        result = self._toggle(mock_session, task)
+
+        assert result is task
+        assert task.completed is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
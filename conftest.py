@@ -0,0 +1,18 @@
+"""Shared setup for the root-level test and debug scripts.
+
+Puts backend/src on sys.path exactly once so every script can import
+utils.scope_validator directly. pytest picks this up automatically
+during collection; direct ``python <script>.py`` runs get the same
+effect by importing this module.
+
+Environment knobs:
+    SCOPE_FAIL_FAST=1  stop test_scope_validation's CLI report at the
+        first mismatch (for PR smoke checks); leave unset for full runs.
+        Under pytest, use ``-x`` instead.
+"""
+import os
+import sys
+
+_BACKEND_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "src")
+if _BACKEND_SRC not in sys.path:
+    sys.path.insert(0, _BACKEND_SRC)
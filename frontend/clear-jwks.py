@@ -1,28 +1,20 @@
 #!/usr/bin/env python3
 """Script to clear JWKS cache from database."""
 
-import os
-import psycopg2
-from dotenv import load_dotenv
+import psycopg
 
-# Load environment variables
-load_dotenv(".env.local")
-
-# Get database URL
-DATABASE_URL = os.getenv("DATABASE_URL")
+from env import get_db_url
 
 try:
-    conn = psycopg2.connect(DATABASE_URL)
-    cur = conn.cursor()
-
-    print("Clearing JWKS cache...")
-    cur.execute("DELETE FROM jwks")
-
-    conn.commit()
-    print(f"Successfully deleted JWKS records!")
-
-    cur.close()
-    conn.close()
+    # Get database URL (cached loader, skips dotenv if already exported)
+    DATABASE_URL = get_db_url()
+    # TRUNCATE is O(1) regardless of row count, unlike DELETE which scans
+    # and WAL-logs every row; the context managers commit and close.
+    with psycopg.connect(DATABASE_URL) as conn, conn.cursor() as cur:
+        print("Clearing JWKS cache...")
+        cur.execute("TRUNCATE TABLE jwks")
+
+    print("Successfully cleared JWKS records!")
 
 except Exception as e:
     print(f"ERROR: {e}")
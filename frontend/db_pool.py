@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Shared psycopg2 connection pool for the database admin scripts."""
+
+from functools import lru_cache
+
+import psycopg2.pool
+
+from env import get_db_url
+
+
+@lru_cache(maxsize=1)
+def get_pool():
+    """Build the pool once per process; later callers reuse it.
+
+    One-shot script runs pay a single handshake as before, but anything
+    importing these scripts in a loop (CI fixtures, seeding) gets
+    zero-handshake connection reuse.
+    """
+    return psycopg2.pool.ThreadedConnectionPool(1, 4, get_db_url())
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Cached environment loading for the database admin scripts."""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def get_db_url():
+    """Return DATABASE_URL, parsing .env.local at most once per process.
+
+    Shells that already export the variable skip the dotenv parse
+    entirely; otherwise the file is read on first call and the result is
+    cached for every later caller.
+    """
+    url = os.environ.get("DATABASE_URL")
+    if url is None:
+        load_dotenv(".env.local")
+        url = os.environ.get("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL not found in environment or .env.local")
+    return url
@@ -1,21 +1,7 @@
 #!/usr/bin/env python3
 """Script to recreate Better Auth database tables."""
 
-import os
-import psycopg2
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv(".env.local")
-
-# Get database URL
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    print("ERROR: DATABASE_URL not found in .env.local")
-    exit(1)
-
-print(f"Connecting to database...")
+from db_pool import get_pool
 
 # Read SQL file
 with open("fix-auth-tables.sql", "r") as f:
@@ -23,17 +9,18 @@ with open("fix-auth-tables.sql", "r") as f:
 
 # Connect and execute
 try:
-    conn = psycopg2.connect(DATABASE_URL)
-    cur = conn.cursor()
-
-    print("Executing SQL to recreate Better Auth tables...")
-    cur.execute(sql)
-
-    conn.commit()
-    print("Successfully recreated Better Auth tables!")
-
-    cur.close()
-    conn.close()
+    print("Connecting to database...")
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        print("Executing SQL to recreate Better Auth tables...")
+        # The with-block commits on success
+        with conn, conn.cursor() as cur:
+            cur.execute(sql)
+
+        print("Successfully recreated Better Auth tables!")
+    finally:
+        pool.putconn(conn)
 
 except Exception as e:
     print(f"ERROR: {e}")
@@ -0,0 +1,95 @@
+"""
+Canonical scope-validation test cases shared by the root-level drivers.
+
+The source of truth is three parallel column tuples per table — messages,
+expected verdicts, descriptions — so batch passes can walk one contiguous
+column without per-row tuple unpacking. The row-oriented views used by
+@pytest.mark.parametrize are zipped from the columns once at import.
+"""
+
+FULL_MESSAGES = (
+    # In-scope messages
+    "Add a task to buy groceries",
+    "Create a new todo for meeting tomorrow",
+    "Show me my tasks",
+    "Update task 5 to high priority",
+    "Delete task 3",
+    "Mark task 1 as complete",
+    "What's on my todo list?",
+    "Set a reminder for the meeting",
+    "I need to finish the report",
+    "Schedule a recurring task",
+    # Out-of-scope messages
+    "Hello, how are you?",
+    "Tell me a joke",
+    "What's the weather like?",
+    "Who invented the internet?",
+    "How to cook pasta?",
+    "What are the latest news?",
+    "Explain quantum physics",
+    "Calculate 2 + 2",
+    "Translate hello to French",
+    "Play a game with me",
+    # Edge cases
+    "",
+    "This is not related to tasks at all",
+    "I want to create a new task to finish my project",
+)
+
+FULL_EXPECTED = (
+    True, True, True, True, True, True, True, True, True, True,
+    False, False, False, False, False, False, False, False, False, False,
+    False, False, True,
+)
+
+FULL_DESCRIPTIONS = (
+    "Adding a task",
+    "Creating a todo",
+    "Listing tasks",
+    "Updating task",
+    "Deleting task",
+    "Completing task",
+    "Asking about tasks",
+    "Setting reminder",
+    "Task-related",
+    "Recurring task",
+    "Greeting",
+    "Requesting joke",
+    "Weather query",
+    "General knowledge",
+    "Recipe request",
+    "News request",
+    "Complex explanation request",
+    "Math calculation",
+    "Translation request",
+    "Game request",
+    "Empty message",
+    "Generic non-task message",
+    "Mixed message with task intent",
+)
+
+INTEGRATION_MESSAGES = (
+    "Add a task to buy groceries",
+    "Hello, how are you?",
+    "Show me my tasks",
+    "Tell me a joke",
+    "What's the weather like?",
+    "Update task 5 to high priority",
+)
+
+INTEGRATION_EXPECTED = (True, False, True, False, False, True)
+
+INTEGRATION_DESCRIPTIONS = (
+    "In-scope task creation",
+    "Out-of-scope greeting",
+    "In-scope task listing",
+    "Out-of-scope request",
+    "Out-of-scope weather query",
+    "In-scope task update",
+)
+
+# Row views for parametrized tests and the CLI reports
+FULL_CASES = tuple(zip(FULL_MESSAGES, FULL_EXPECTED, FULL_DESCRIPTIONS))
+INTEGRATION_CASES = tuple(
+    zip(INTEGRATION_MESSAGES, INTEGRATION_EXPECTED, INTEGRATION_DESCRIPTIONS)
+)
@@ -0,0 +1,15 @@
+"""Allow running the application as ``python -m src``.
+
+Puts the package directory on ``sys.path`` so the flat imports used
+throughout the layers resolve, then delegates to :func:`main.main`.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from main import main
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,17 @@ class TaskNotFoundError(Exception):
         task_id: The ID of the task that was not found
     """
 
+    # Store only the ID at raise time; the message is formatted lazily
+    # in __str__, so raises that are caught and inspected by task_id
+    # never pay for building the string
+    __slots__ = ("task_id",)
+
     def __init__(self, task_id: int) -> None:
+        super().__init__(task_id)
         self.task_id = task_id
-        super().__init__(f"Task ID {task_id} not found")
+
+    def __str__(self) -> str:
+        return f"Task ID {self.task_id} not found"
 
 
 class InvalidTaskError(Exception):
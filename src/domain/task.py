@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single todo task.
 
@@ -26,6 +26,9 @@ class Task:
     completed: bool = False
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # Indexed by the completed flag: False -> 0, True -> 1
+    _STATUS = ("[ ]", "[X]")
+
     @property
     def status_indicator(self) -> str:
         """Return status indicator for console display.
@@ -33,4 +36,4 @@ class Task:
         Returns:
             '[X]' if completed, '[ ]' if incomplete
         """
-        return "[X]" if self.completed else "[ ]"
+        return self._STATUS[self.completed]
@@ -24,6 +24,9 @@ class TaskRepository:
         """Initialize empty task repository."""
         self._tasks: dict[int, Task] = {}
         self._next_id: int = 1
+        # Pre-bound clock: skips the module-global and attribute lookups
+        # on every batch timestamp read
+        self._now = datetime.now
 
     def create(self, title: str, description: str = "") -> Task:
         """Create and store a new task.
@@ -35,17 +38,47 @@ class TaskRepository:
         Returns:
             Newly created task with auto-generated ID
         """
+        # created_at comes from the dataclass default_factory, which does
+        # exactly datetime.now(timezone.utc); no need to pass it here
         task = Task(
             id=self._next_id,
             title=title,
             description=description,
             completed=False,
-            created_at=datetime.now(timezone.utc),
         )
         self._tasks[self._next_id] = task
         self._next_id += 1
         return task
 
+    def bulk_create(self, items: list[tuple[str, str]]) -> list[Task]:
+        """Create and store many tasks in one call.
+
+        Assigns a contiguous ID range and stamps every task with a single
+        shared timestamp, amortizing the clock read and the per-item dict
+        bookkeeping that looped create() calls would pay.
+
+        Args:
+            items: List of (title, description) tuples
+
+        Returns:
+            List of newly created tasks, in input order
+        """
+        start = self._next_id
+        now = self._now(timezone.utc)
+        tasks = [
+            Task(
+                id=start + i,
+                title=title,
+                description=description,
+                completed=False,
+                created_at=now,
+            )
+            for i, (title, description) in enumerate(items)
+        ]
+        self._tasks.update((task.id, task) for task in tasks)
+        self._next_id = start + len(tasks)
+        return tasks
+
     def get_by_id(self, task_id: int) -> Task:
         """Retrieve task by ID.
 
@@ -58,9 +91,12 @@ class TaskRepository:
         Raises:
             TaskNotFoundError: If task_id not found in storage
         """
-        if task_id not in self._tasks:
+        # Single dict probe: get() hashes the key once, where the
+        # membership test plus subscript would hash it twice
+        task = self._tasks.get(task_id)
+        if task is None:
             raise TaskNotFoundError(task_id)
-        return self._tasks[task_id]
+        return task
 
     def get_all(self) -> list[Task]:
         """Retrieve all tasks in insertion order.
@@ -70,6 +106,19 @@ class TaskRepository:
         """
         return list(self._tasks.values())
 
+    def iter_rows(self):
+        """Yield (id, completed, title, description) tuples in insertion order.
+
+        Display-only callers scan every task but never mutate one; plain
+        tuples skip the per-row attribute and property dispatch that a
+        Task-object walk pays.
+
+        Yields:
+            (id, completed, title, description) per stored task
+        """
+        for task in self._tasks.values():
+            yield task.id, task.completed, task.title, task.description
+
     def update(self, task_id: int, title: str | None = None, description: str | None = None) -> Task:
         """Update task title and/or description.
 
@@ -102,9 +151,10 @@ class TaskRepository:
         Raises:
             TaskNotFoundError: If task_id not found in storage
         """
-        if task_id not in self._tasks:
-            raise TaskNotFoundError(task_id)
-        del self._tasks[task_id]
+        try:
+            del self._tasks[task_id]
+        except KeyError:
+            raise TaskNotFoundError(task_id) from None
 
     def toggle_status(self, task_id: int) -> Task:
         """Toggle task completion status.
@@ -52,6 +52,15 @@ class TaskService:
         """
         return self._repository.get_all()
 
+    def list_task_rows(self) -> list[tuple[int, bool, str, str]]:
+        """Get all tasks as display rows.
+
+        Returns:
+            List of (id, completed, title, description) tuples in
+            insertion order, for read-only display use
+        """
+        return list(self._repository.iter_rows())
+
     def get_task(self, task_id: int) -> Task:
         """Get a specific task by ID.
 
@@ -83,13 +92,14 @@ class TaskService:
             TaskNotFoundError: If task not found
             InvalidTaskError: If new title is empty (when provided)
         """
-        # If title is provided and not empty, validate it
-        if title is not None and title.strip():
-            self._validate_title(title)
-            title = title.strip()
-        elif title is not None and not title.strip():
-            # Empty string provided - means keep current title
-            title = None
+        # Strip each field once and branch on the result; blank titles
+        # mean "keep current", so only a non-empty one is length-checked
+        if title is not None:
+            title = title.strip() or None
+            if title is not None and len(title) > self.MAX_TITLE_LENGTH:
+                raise InvalidTaskError(
+                    f"Title too long (max {self.MAX_TITLE_LENGTH} characters)"
+                )
 
         # If description provided, strip it; if empty string, keep as empty
         if description is not None:
@@ -4,6 +4,8 @@ This module provides console display formatting and I/O utilities
 for the Todo application.
 """
 
+import sys
+
 from domain.task import Task
 
 
@@ -16,6 +18,7 @@ class ConsoleUI:
 
     # Display constants
     MAX_TITLE_LENGTH = 70
+    _TRUNC = MAX_TITLE_LENGTH - 3
     MENU_OPTIONS = [
         "1. Add Task",
         "2. View All Tasks",
@@ -25,12 +28,13 @@ class ConsoleUI:
         "6. Exit",
     ]
 
+    # The menu never changes, and the main loop renders it every
+    # iteration: precompute the whole block once at class-body time
+    _MENU_STR = "\n=== Todo App ===\n" + "\n".join(MENU_OPTIONS) + "\n\n"
+
     def display_menu(self) -> None:
         """Display the main menu options."""
-        print("\n=== Todo App ===")
-        for option in self.MENU_OPTIONS:
-            print(option)
-        print()
+        sys.stdout.write(self._MENU_STR)
 
     def display_tasks(self, tasks: list[Task]) -> None:
         """Display all tasks in a formatted list.
@@ -38,29 +42,34 @@ class ConsoleUI:
         Args:
             tasks: List of Task objects to display
         """
-        print("\n=== All Tasks ===\n")
-
-        if not tasks:
-            print("No tasks yet. Add a task to get started!")
-            return
+        self.display_task_rows(
+            [(t.id, t.completed, t.title, t.description) for t in tasks]
+        )
 
-        for task in tasks:
-            self._display_single_task(task)
-            print()
+    def display_task_rows(self, rows: list[tuple[int, bool, str, str]]) -> None:
+        """Display tasks from plain display rows.
 
-    def _display_single_task(self, task: Task) -> None:
-        """Display a single task with formatting.
+        The whole listing is built as one string and written in a single
+        call, so N tasks cost one stdout lock/flush cycle instead of a
+        print per line.
 
         Args:
-            task: Task object to display
+            rows: List of (id, completed, title, description) tuples
         """
-        title = self._format_title(task.title)
-        print(f"[{task.id}] {task.status_indicator} {title}")
+        if not rows:
+            sys.stdout.write(
+                "\n=== All Tasks ===\n\nNo tasks yet. Add a task to get started!\n"
+            )
+            return
 
-        if task.description:
-            print(f"    Description: {task.description}")
-        else:
-            print("    Description: (No description)")
+        buf = ["\n=== All Tasks ===\n"]
+        for task_id, completed, title, description in rows:
+            buf.append(
+                f"[{task_id}] {Task._STATUS[completed]} {self._format_title(title)}\n"
+                f"    Description: {description or '(No description)'}\n"
+            )
+        sys.stdout.write("\n".join(buf))
+        sys.stdout.write("\n")
 
     def _format_title(self, title: str) -> str:
         """Format title for console display with truncation.
@@ -71,9 +80,7 @@ class ConsoleUI:
         Returns:
             Formatted title (truncated with '...' if > MAX_TITLE_LENGTH)
         """
-        if len(title) <= self.MAX_TITLE_LENGTH:
-            return title
-        return title[: self.MAX_TITLE_LENGTH - 3] + "..."
+        return title if len(title) <= self.MAX_TITLE_LENGTH else f"{title[:self._TRUNC]}..."
 
     def display_success(self, message: str) -> None:
         """Display a success message.
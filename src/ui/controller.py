@@ -48,26 +48,28 @@ class Controller:
         except KeyboardInterrupt:
             self._console.display_goodbye()
 
+    # Choice-to-handler-name dispatch table, built once at class-definition
+    # time instead of rebinding six methods on every keypress
+    _HANDLERS = {
+        "1": "_add_task",
+        "2": "_view_tasks",
+        "3": "_update_task",
+        "4": "_delete_task",
+        "5": "_toggle_status",
+        "6": "_exit",
+    }
+
     def _handle_choice(self, choice: str) -> None:
         """Route user choice to appropriate handler.
 
         Args:
             choice: User's menu selection
         """
-        handlers = {
-            "1": self._add_task,
-            "2": self._view_tasks,
-            "3": self._update_task,
-            "4": self._delete_task,
-            "5": self._toggle_status,
-            "6": self._exit,
-        }
-
-        handler = handlers.get(choice)
-        if handler:
-            handler()
-        else:
+        name = self._HANDLERS.get(choice)
+        if name is None:
             self._console.display_error("Invalid choice. Please enter 1-6.")
+            return
+        getattr(self, name)()
 
     def _add_task(self) -> None:
         """Handle add task operation."""
@@ -83,8 +85,8 @@ class Controller:
 
     def _view_tasks(self) -> None:
         """Handle view all tasks operation."""
-        tasks = self._service.list_tasks()
-        self._console.display_tasks(tasks)
+        rows = self._service.list_task_rows()
+        self._console.display_task_rows(rows)
 
     def _update_task(self) -> None:
         """Handle update task operation."""
@@ -155,12 +157,16 @@ class Controller:
         """
         id_str = self._console.get_task_id(prompt)
 
-        try:
-            task_id = int(id_str)
-            if task_id <= 0:
-                self._console.display_error("Invalid ID format. Please enter a positive number.")
-                return None
-            return task_id
-        except ValueError:
+        # isdecimal is a C-level scan that accepts exactly what int() does;
+        # isdigit would also pass superscripts like "²", which int() rejects.
+        # Checking up front means the invalid path never pays for raising
+        # and catching ValueError
+        if not id_str.isdecimal():
             self._console.display_error("Invalid ID format. Please enter a numeric ID.")
             return None
+
+        task_id = int(id_str)
+        if task_id == 0:
+            self._console.display_error("Invalid ID format. Please enter a positive number.")
+            return None
+        return task_id
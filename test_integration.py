@@ -2,48 +2,55 @@
 Test script to verify the integration of scope validation with the agent runner.
 """
 import sys
-import os
 
-# Add the backend src directory to the path so we can import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'src'))
+import pytest
 
-from utils.scope_validator import is_message_in_scope
+import conftest  # noqa: F401  # puts backend/src on sys.path
 
+from scope_cases import INTEGRATION_CASES as TEST_CASES
+from utils.scope_validator import check_message_scope, scope_reason_text
 
-def test_integration():
-    """Test the integration by verifying the scope validation works as expected."""
-    print("Testing integration of scope validation with the agent runner...")
 
-    # Test cases
-    test_cases = [
-        ("Add a task to buy groceries", True, "In-scope task creation"),
-        ("Hello, how are you?", False, "Out-of-scope greeting"),
-        ("Show me my tasks", True, "In-scope task listing"),
-        ("Tell me a joke", False, "Out-of-scope request"),
-        ("What's the weather like?", False, "Out-of-scope weather query"),
-        ("Update task 5 to high priority", True, "In-scope task update"),
-    ]
+@pytest.mark.parametrize("message,expected_in_scope,description", TEST_CASES)
+def test_integration_case(message, expected_in_scope, description):
+    """Each case runs as its own test, so a failure names the exact message."""
+    is_in_scope, code = check_message_scope(message)
+    assert is_in_scope == expected_in_scope, (
+        f"{description}: '{message}' -> {is_in_scope}, "
+        f"reason: {scope_reason_text(code, message)}"
+    )
 
-    all_passed = True
+
+def run_report(test_cases=TEST_CASES):
+    """Run every case and print a summary, formatting details only for failures."""
+    # Passing cases never touch the formatter: the loop just counts them,
+    # so the common all-green run allocates no per-case strings. Lines are
+    # still buffered and emitted in one stdout write.
+    out = ["Testing integration of scope validation with the agent runner..."]
+    passed = 0
     for message, expected_in_scope, description in test_cases:
-        is_in_scope, reason = is_message_in_scope(message)
-        status = "PASS" if is_in_scope == expected_in_scope else "FAIL"
-        if is_in_scope != expected_in_scope:
-            all_passed = False
-        print(f"[{status}] '{message}' -> {is_in_scope} ({description})")
-        if is_in_scope != expected_in_scope:
-            print(f"    Expected: {expected_in_scope}, Got: {is_in_scope}")
-            print(f"    Reason: {reason}")
+        is_in_scope, code = check_message_scope(message)
+        if is_in_scope == expected_in_scope:
+            passed += 1
+            continue
+        out.append(f"[FAIL] '{message}' -> {is_in_scope} ({description})")
+        out.append(f"    Expected: {expected_in_scope}, Got: {is_in_scope}")
+        out.append(f"    Reason: {scope_reason_text(code, message)}")
+
+    all_passed = passed == len(test_cases)
+    out.append(f"{passed}/{len(test_cases)} passed")
 
-    print(f"\nOverall result: {'All tests passed!' if all_passed else 'Some tests failed!'}")
+    out.append(f"\nOverall result: {'All tests passed!' if all_passed else 'Some tests failed!'}")
 
-    print("\nIntegration summary:")
-    print("- The scope validation function is properly implemented in utils/scope_validator.py")
-    print("- The agent runner (agents/agent_runner.py) imports and uses the scope validation")
-    print("- Both run_agent_with_tools() and run_agent_stream() functions check scope before processing")
-    print("- Out-of-scope messages return a validation message instead of processing with the AI agent")
-    print("- This ensures the chatbot only responds to task-related queries")
+    out.append("\nIntegration summary:")
+    out.append("- The scope validation function is properly implemented in utils/scope_validator.py")
+    out.append("- The agent runner (agents/agent_runner.py) imports and uses the scope validation")
+    out.append("- Both run_agent_with_tools() and run_agent_stream() functions check scope before processing")
+    out.append("- Out-of-scope messages return a validation message instead of processing with the AI agent")
+    out.append("- This ensures the chatbot only responds to task-related queries")
+    sys.stdout.write("\n".join(out) + "\n")
+    return all_passed
 
 
 if __name__ == "__main__":
-    test_integration()
\ No newline at end of file
+    run_report()